@@ -30,22 +30,22 @@ class AchievementSystem:
         for key in self.counters:
             self.counters[key] = 0
 
-    def check_achievement(self, event):
+    def check_achievement(self, event, count=1):
         if event == 'enemy_kill':
-            self.counters['kills'] += 1
-            if self.counters['kills'] == 1:
+            self.counters['kills'] += count
+            if self.counters['kills'] >= 1:
                 self.achievements['first_kill']['unlocked'] = True
-            if self.counters['kills'] == 10:
+            if self.counters['kills'] >= 10:
                 self.achievements['10_kills']['unlocked'] = True
-            if self.counters['kills'] == 100:
+            if self.counters['kills'] >= 100:
                 self.achievements['100_kills']['unlocked'] = True
         elif event == 'powerup_collect':
-            self.counters['powerups'] += 1
-            if self.counters['powerups'] == 50:
+            self.counters['powerups'] += count
+            if self.counters['powerups'] >= 50:
                 self.achievements['powerup_master']['unlocked'] = True
         elif event == 'boss_kill':
-            self.counters['bosses'] += 1
-            if self.counters['bosses'] == 1:
+            self.counters['bosses'] += count
+            if self.counters['bosses'] >= 1:
                 self.achievements['boss_slayer']['unlocked'] = True
         # Add checks for all achievements
 
@@ -1,6 +1,6 @@
 # ai.py - Expanded AI behaviors
-import random
 from constants import AI_AGGRESSION_LOW, AI_AGGRESSION_HIGH
+from rng import rng
 
 class EnemyAI:
     """
@@ -8,7 +8,7 @@ class EnemyAI:
     """
     def __init__(self, enemy):
         self.enemy = enemy
-        self.aggression = random.uniform(AI_AGGRESSION_LOW, AI_AGGRESSION_HIGH)
+        self.aggression = rng.ai.uniform(AI_AGGRESSION_LOW, AI_AGGRESSION_HIGH)
 
     def update(self, player, enemy_bullets):
         # Base behavior
@@ -1,6 +1,7 @@
 # animation.py - Expanded animations for various objects
 import pygame
 from constants import ANIMATION_FRAME_RATE
+from game_clock import game_clock
 
 class AnimationManager:
     """
@@ -25,10 +26,10 @@ class PlayerAnimation:
         self.frames = [player.image.copy() for _ in range(5)]  # Placeholder frames
         self.current_frame = 0
         self.frame_delay = ANIMATION_FRAME_RATE
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = game_clock.get_ticks()
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_update > self.frame_delay:
             self.current_frame = (self.current_frame + 1) % len(self.frames)
             self.last_update = now
@@ -364,10 +364,11 @@ while running:
         score_system.update()
 
         # Collision handling
-        collision_manager.handle_player_enemies(player, enemies, particles, sound_manager, score_system, achievements)
-        collision_manager.handle_bullets_enemies(player_bullets, enemies, particles, sound_manager, score_system, achievements)
-        collision_manager.handle_powerups(player, powerups, sound_manager, achievements)
-        collision_manager.handle_enemy_bullets(player, enemy_bullets, sound_manager)
+        collision_manager.handle_player_enemies(player, enemies)
+        collision_manager.handle_bullets_enemies(player_bullets, enemies)
+        collision_manager.handle_powerups(player, powerups)
+        collision_manager.handle_enemy_bullets(player, enemy_bullets)
+        collision_manager.dispatch(particles, sound_manager, score_system, achievements)
 
         # Check for game over
         if player.health <= 0:
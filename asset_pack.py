@@ -0,0 +1,175 @@
+# asset_pack.py - New module for the preprocessed, memory-mapped asset pack
+"""
+Build step and runtime reader for a single-file asset pack. The build decodes
+every image and sound in the ResourceLoader manifest once and stores
+raw BGRA pixels (the usual 32-bit display layout) and raw PCM in the mixer's
+format, so launching the game decodes nothing. At runtime the pack is mapped
+with mmap and entries are turned into surfaces and sounds on first use.
+
+Layout: MAGIC, then <version, index length> as two little-endian uint32, then
+the JSON index, then the entry blobs, each aligned to PACK_ALIGN bytes.
+
+Build from the repository root: python asset_pack.py
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+import pygame
+from constants import ASSET_DIR, ASSET_PACK_PATH
+
+MAGIC = b'SSPK'
+PACK_VERSION = 1  # Bump when the layout changes; older packs are then ignored
+PACK_ALIGN = 16
+HEADER = struct.Struct('<II')
+
+def _align(offset):
+    return -offset % PACK_ALIGN
+
+def build_pack(manifest, asset_dir=ASSET_DIR, path=ASSET_PACK_PATH):
+    """
+    Decode every asset in manifest and write the pack to path. Returns the index
+    and the list of (name, error) for assets that could not be decoded.
+    """
+    index = {'mixer': list(pygame.mixer.get_init() or ()), 'entries': {}}
+    blobs = []
+    failed = []
+    for assets in manifest.values():
+        for kind, name, file in assets:
+            if name in index['entries']:
+                continue
+            source = os.path.join(asset_dir, file)
+            try:
+                if kind == 'image':
+                    image = pygame.image.load(source)
+                    colorkey = image.get_colorkey()
+                    entry = {
+                        'kind': 'image',
+                        'size': list(image.get_size()),
+                        'alpha': bool(image.get_flags() & pygame.SRCALPHA),
+                        'colorkey': list(colorkey) if colorkey is not None else None,
+                    }
+                    blob = pygame.image.tobytes(image, 'BGRA')
+                else:
+                    entry = {'kind': 'sound'}
+                    blob = pygame.mixer.Sound(source).get_raw()
+            except (pygame.error, OSError) as error:
+                failed.append((name, error))
+                continue
+            entry['length'] = len(blob)
+            index['entries'][name] = entry
+            blobs.append((entry, blob))
+
+    # Offsets depend on the index length, which depends on the offsets' digits;
+    # reserve generous padding after the index instead of iterating
+    for entry, blob in blobs:
+        entry['offset'] = 0
+    reserved = len(json.dumps(index).encode()) + 16 * len(blobs) + PACK_ALIGN
+    offset = len(MAGIC) + HEADER.size + reserved
+    offset += _align(offset)
+    for entry, blob in blobs:
+        entry['offset'] = offset
+        offset += len(blob) + _align(len(blob))
+    encoded = json.dumps(index).encode().ljust(reserved)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + HEADER.pack(PACK_VERSION, len(encoded)) + encoded)
+        for entry, blob in blobs:
+            f.write(bytes(entry['offset'] - f.tell()))
+            f.write(blob)
+    os.replace(tmp_path, path)
+    return index, failed
+
+class AssetPack:
+    """
+    Read-only view of a built pack. image() and sound() materialize an entry the
+    first time it is asked for and cache it. Raises ValueError for files that are
+    not packs of the current version.
+    """
+    def __init__(self, path=ASSET_PACK_PATH):
+        self.file = open(path, 'rb')
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            start = len(MAGIC) + HEADER.size
+            if self.data[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not an asset pack")
+            version, index_length = HEADER.unpack(self.data[len(MAGIC):start])
+            if version != PACK_VERSION:
+                raise ValueError(f"{path} has pack version {version}, expected {PACK_VERSION}")
+            index = json.loads(self.data[start:start + index_length])
+        except Exception:
+            self.file.close()
+            raise
+        self.entries = index['entries']
+        self.mixer = tuple(index['mixer'])
+        self.surfaces = {}
+        self.sounds = {}
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def _view(self, entry):
+        return memoryview(self.data)[entry['offset']:entry['offset'] + entry['length']]
+
+    def has_sound(self, name):
+        """
+        PCM is only usable when the mixer runs in the format the pack was built with.
+        """
+        entry = self.entries.get(name)
+        return entry is not None and entry['kind'] == 'sound' and pygame.mixer.get_init() == self.mixer
+
+    def image(self, name):
+        surface = self.surfaces.get(name)
+        if surface is not None:
+            return surface
+        entry = self.entries[name]
+        mapped = pygame.image.frombuffer(self._view(entry), entry['size'], 'BGRA')
+        # Copy out of the mapping; converting does that and picks the display format
+        if pygame.display.get_surface() is None:
+            surface = mapped.copy()
+        elif entry['colorkey'] is not None:
+            surface = mapped.convert()
+            surface.set_colorkey(entry['colorkey'], pygame.RLEACCEL)
+        elif entry['alpha']:
+            surface = mapped.convert_alpha()
+        else:
+            surface = mapped.convert()
+        del mapped
+        self.surfaces[name] = surface
+        return surface
+
+    def sound(self, name):
+        sound = self.sounds.get(name)
+        if sound is None:
+            sound = pygame.mixer.Sound(buffer=self._view(self.entries[name]))
+            self.sounds[name] = sound
+        return sound
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--assets', default=ASSET_DIR)
+    parser.add_argument('--output', default=ASSET_PACK_PATH)
+    args = parser.parse_args()
+
+    from resource_loader import ASSET_MANIFEST
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.mixer.init()  # Sounds are stored in the mixer's default output format
+    index, failed = build_pack(ASSET_MANIFEST, args.assets, args.output)
+    for name, error in failed:
+        print(f"skipped {name}: {error}", file=sys.stderr)
+    size = os.path.getsize(args.output)
+    print(f"Packed {len(index['entries'])} assets into {args.output} ({size / 1024:.0f} KiB)")
+    pygame.mixer.quit()
+
+if __name__ == "__main__":
+    main()
@@ -1,70 +1,304 @@
 # background.py - Expanded with multiple layers and effects
 import pygame
-import random
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, STAR_SPEED, COLOR_BLACK, COLOR_WHITE
+import numpy as np
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, STAR_SPEED, STAR_COUNT, STAR_MAX_SIZE,
+    STAR_BAKE_THRESHOLD, BACKGROUND_SEED, BAND_GAP, COLOR_BLACK, COLOR_WHITE
+)
+from procedural import bitmap_cache
+from rng import rng
+
+def wrap_strip(tile):
+    """
+    Stack a tile twice vertically so any tile-high window of the result is the
+    tile scrolled with wrap-around. Pixels, alpha included, are copied exactly.
+    """
+    width, height = tile.get_size()
+    flags = tile.get_flags() & pygame.SRCALPHA
+    strip = pygame.Surface((width, height * 2), flags, tile)
+    strip.fill((0, 0, 0, 0))
+    for y in (0, height):
+        strip.blit(tile, (0, y), special_flags=pygame.BLEND_RGBA_MAX if flags else 0)
+    return strip
 
 class Background:
     """
-    Base scrolling background.
+    Base scrolling background. image is a ring strip twice the screen height whose
+    bottom half repeats the top half, so every frame is a single screen-sized blit.
     """
+    opaque = True  # Hides every layer drawn before it
+    dynamic = False  # Redrawn every frame rather than composited
+    uniform = True  # A solid fill, so scrolling it changes no pixels
+
     def __init__(self):
-        self.image = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT * 2))
-        self.image.fill(COLOR_BLACK)
+        tile = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        tile.fill(COLOR_BLACK)
+        self.image = wrap_strip(tile)
         self.rect = self.image.get_rect()
         self.rect.y = -SCREEN_HEIGHT
         self.speed = 1
+        self.scroll = 0.0
+
+    @property
+    def pixel_offset(self):
+        return int(self.scroll)
+
+    def view_area(self):
+        """
+        Area of image currently on screen.
+        """
+        return pygame.Rect(0, SCREEN_HEIGHT - self.pixel_offset, SCREEN_WIDTH, SCREEN_HEIGHT)
 
     def update(self):
-        self.rect.y += self.speed
-        if self.rect.y >= 0:
-            self.rect.y = -SCREEN_HEIGHT
+        self.scroll = (self.scroll + self.speed) % SCREEN_HEIGHT
+        self.rect.y = self.pixel_offset - SCREEN_HEIGHT
 
     def draw(self, screen):
-        screen.blit(self.image, self.rect)
-        screen.blit(self.image, (0, self.rect.y + SCREEN_HEIGHT))
+        screen.blit(self.image, (0, 0), self.view_area())
+
+    def content_bands(self):
+        """
+        Runs of tile rows holding visible pixels as (top, bottom, left, right),
+        with gaps shorter than BAND_GAP rows bridged. Computed once per image.
+        """
+        if getattr(self, '_bands_image', None) is not self.image:
+            alpha = pygame.surfarray.array_alpha(self.image)[:, :SCREEN_HEIGHT]
+            rows = np.flatnonzero(alpha.any(axis=0))
+            runs = np.split(rows, np.flatnonzero(np.diff(rows) > BAND_GAP) + 1) if len(rows) else []
+            self._bands = []
+            for run in runs:
+                columns = np.flatnonzero(alpha[:, run[0]:run[-1] + 1].any(axis=1))
+                self._bands.append((int(run[0]), int(run[-1]) + 1, int(columns[0]), int(columns[-1]) + 1))
+            self._bands_image = self.image
+        return self._bands
+
+    def scrolled_rects(self, old_offset, new_offset):
+        """
+        Screen rects whose pixels differ after scrolling down from old_offset to
+        new_offset: each content band from its old to its new position, split
+        where it wraps past the bottom.
+        """
+        rects = []
+        delta = (new_offset - old_offset) % SCREEN_HEIGHT
+        for top, bottom, left, right in self.content_bands():
+            # Tile row t shows at screen row (t + offset) % SCREEN_HEIGHT
+            height = min(bottom - top + delta, SCREEN_HEIGHT)
+            start = (top + old_offset) % SCREEN_HEIGHT if height < SCREEN_HEIGHT else 0
+            rects.append(pygame.Rect(left, start, right - left, min(height, SCREEN_HEIGHT - start)))
+            if start + height > SCREEN_HEIGHT:
+                rects.append(pygame.Rect(left, 0, right - left, start + height - SCREEN_HEIGHT))
+        return rects
 
 class StarField(Background):
     """
-    Star field layer.
+    Star field layer. Star positions, sizes and speeds live in NumPy arrays.
+    Small fields blit one pre-rendered stamp per star; fields larger than
+    bake_threshold are baked once into one wrapped strip per speed class,
+    so drawing costs the same no matter how many stars there are.
     """
-    def __init__(self):
+    opaque = False
+    dynamic = True
+    uniform = False
+
+    def __init__(self, count=STAR_COUNT, bake_threshold=STAR_BAKE_THRESHOLD):
         super().__init__()
-        self.stars = []
-        for _ in range(300):  # More stars
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT * 2)
-            size = random.randint(1, 4)
-            speed = STAR_SPEED * size / 2
-            self.stars.append((x, y, size, speed))
+        self.rng = rng.numpy('cosmetic')
+        self.count = count
+        self.x = self.rng.integers(0, SCREEN_WIDTH, count, endpoint=True).astype(np.float32)
+        self.y = self.rng.integers(0, SCREEN_HEIGHT * 2, count, endpoint=True).astype(np.float32)
+        self.size = self.rng.integers(1, STAR_MAX_SIZE, count, endpoint=True)
+        self.speed = (STAR_SPEED * self.size / 2).astype(np.float32)
+        self.stamps = np.empty(STAR_MAX_SIZE + 1, dtype=object)
+        for size in range(1, STAR_MAX_SIZE + 1):
+            stamp = pygame.Surface((size * 2 + 1, size * 2 + 1))
+            pygame.draw.circle(stamp, COLOR_WHITE, (size, size), size)
+            stamp.set_colorkey(COLOR_BLACK, pygame.RLEACCEL)
+            self.stamps[size] = stamp
+        self.baked = count > bake_threshold
+        if self.baked:
+            self.strips = [self._bake_strip(size) for size in range(1, STAR_MAX_SIZE + 1)]
+            self.strip_speed = STAR_SPEED * np.arange(1, STAR_MAX_SIZE + 1, dtype=np.float32) / 2
+            self.strip_offset = np.zeros(STAR_MAX_SIZE, dtype=np.float32)
+
+    def _bake_strip(self, size):
+        """
+        Render every star of one size (and so one speed) into a screen-sized strip
+        that wraps vertically.
+        """
+        strip = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        strip.set_colorkey(COLOR_BLACK, pygame.RLEACCEL)
+        mask = self.size == size
+        x = self.x[mask].astype(np.int32) - size
+        y = self.y[mask].astype(np.int32) % SCREEN_HEIGHT - size
+        stamp = self.stamps[size]
+        # Stars crossing the top or bottom edge are drawn again on the other side
+        for dy in (0, -SCREEN_HEIGHT, SCREEN_HEIGHT):
+            strip.blits(((stamp, xy) for xy in zip(x.tolist(), (y + dy).tolist())), doreturn=False)
+        return strip
 
     def update(self):
-        for i in range(len(self.stars)):
-            x, y, size, speed = self.stars[i]
-            y += speed
-            if y > SCREEN_HEIGHT * 2:
-                y = 0
-                x = random.randint(0, SCREEN_WIDTH)
-            self.stars[i] = (x, y, size, speed)
+        if self.baked:
+            self.strip_offset += self.strip_speed
+            self.strip_offset %= SCREEN_HEIGHT
+            return
+        self.y += self.speed
+        wrapped = self.y > SCREEN_HEIGHT * 2
+        if wrapped.any():
+            self.y[wrapped] = 0
+            self.x[wrapped] = self.rng.integers(0, SCREEN_WIDTH, int(wrapped.sum()), endpoint=True)
 
     def draw(self, screen):
-        for x, y, size, _ in self.stars:
-            pygame.draw.circle(screen, COLOR_WHITE, (x, int(y) % SCREEN_HEIGHT), size)
-            pygame.draw.circle(screen, COLOR_WHITE, (x, int(y - SCREEN_HEIGHT) % SCREEN_HEIGHT), size)
+        """
+        Returns the rects of the drawn stars; baked fields change the whole screen.
+        """
+        if self.baked:
+            for strip, offset in zip(self.strips, self.strip_offset.astype(np.int32).tolist()):
+                screen.blit(strip, (0, offset))
+                screen.blit(strip, (0, offset - SCREEN_HEIGHT))
+            return [screen.get_rect()]
+        x = self.x.astype(np.int32) - self.size
+        y = self.y.astype(np.int32) % SCREEN_HEIGHT - self.size
+        return screen.blits(zip(self.stamps[self.size], zip(x.tolist(), y.tolist())))
 
-class NebulaBackground(Background):
+class ProceduralBackground(Background):
     """
-    Nebula cloud layer.
+    Layer whose image is generated procedurally for a level and cached on disk
+    per seed and level. set_level swaps in the image of another level.
     """
-    def __init__(self):
+    opaque = False
+    uniform = False
+    kind = None  # BitmapCache generator name
+
+    def __init__(self, level=1, seed=BACKGROUND_SEED):
         super().__init__()
+        self.seed = seed
+        self.set_level(level)
+
+    def set_level(self, level):
+        self.level = level
+        self.image = wrap_strip(bitmap_cache.surface(self.kind, self.seed, level, SCREEN_WIDTH, SCREEN_HEIGHT))
+
+class NebulaBackground(ProceduralBackground):
+    """
+    Nebula cloud layer.
+    """
+    kind = 'nebula'
+
+    def __init__(self, level=1, seed=BACKGROUND_SEED):
+        super().__init__(level, seed)
         self.speed = 0.5
-        # Generate nebula images placeholder
 
-class PlanetBackground(Background):
+class PlanetBackground(ProceduralBackground):
     """
     Planetary bodies layer.
     """
-    def __init__(self):
-        super().__init__()
+    kind = 'planets'
+
+    def __init__(self, level=1, seed=BACKGROUND_SEED):
+        super().__init__(level, seed)
         self.speed = 0.2
-        # Generate planets placeholder
+
+class _LayerGroup:
+    """
+    Run of consecutive static layers composited into one cached surface.
+    """
+    def __init__(self, layers):
+        self.layers = layers
+        self.surface = None
+        self.load_images()
+
+    def load_images(self):
+        """
+        Take the layers' current images; the next draw recomposites them.
+        """
+        if self.layers[0].opaque:
+            self.images = [layer.image for layer in self.layers]
+        else:
+            self.images = [layer.image.premul_alpha() for layer in self.layers]
+        self.offsets = None
+
+class BackgroundCompositor:
+    """
+    Draws background layers (bottom first) through cached composites. Consecutive
+    static layers are merged into one surface that is rebuilt only when one of
+    their scroll offsets crosses a pixel boundary; dynamic layers such as StarField
+    draw live in between. Layers under the topmost opaque static layer are skipped.
+    A group reports only the bands its scrolled layers' visible pixels moved
+    through; a scrolling solid fill or a group that did not move reports nothing.
+    pixels_pushed holds how many pixels the compositor blitted in the last draw.
+    """
+    def __init__(self, layers):
+        layers = list(layers)
+        start = max((i for i, layer in enumerate(layers) if layer.opaque and not layer.dynamic), default=0)
+        self.groups = []
+        for layer in layers[start:]:
+            if layer.dynamic:
+                self.groups.append(layer)
+            elif self.groups and isinstance(self.groups[-1], list):
+                self.groups[-1].append(layer)
+            else:
+                self.groups.append([layer])
+        self.groups = [_LayerGroup(group) if isinstance(group, list) else group for group in self.groups]
+        self.pixels_pushed = 0
+        self.recomposites = 0
+
+    def refresh(self):
+        """
+        Call after a layer's image changes, as on a level change; the next
+        draw recomposites every group and reports the whole screen.
+        """
+        for group in self.groups:
+            if isinstance(group, _LayerGroup):
+                group.load_images()
+
+    def draw(self, screen):
+        """
+        Returns the rects that changed since the previous draw.
+        """
+        pushed = 0
+        changed = []
+        for group in self.groups:
+            if isinstance(group, _LayerGroup):
+                area, rects = self._draw_group(screen, group)
+                pushed += area
+                changed.extend(rects)
+            else:
+                changed.extend(group.draw(screen))
+        self.pixels_pushed = pushed
+        return changed
+
+    def _draw_group(self, screen, group):
+        """
+        Draw one group; returns (pixels pushed, rects changed by scrolling).
+        Uniform layers look the same at every offset, so they are left out.
+        """
+        screen_area = SCREEN_WIDTH * SCREEN_HEIGHT
+        layers = [layer for layer in group.layers if not layer.uniform]
+        offsets = tuple(layer.pixel_offset for layer in layers)
+        if group.offsets is None:
+            changed = [screen.get_rect()]
+        else:
+            changed = [rect for layer, old, new in zip(layers, group.offsets, offsets) if old != new
+                       for rect in layer.scrolled_rects(old, new)]
+        scrolled = offsets != group.offsets
+        if len(group.layers) == 1:
+            group.layers[0].draw(screen)
+            group.offsets = offsets
+            return screen_area, changed
+        pushed = screen_area
+        opaque = group.layers[0].opaque
+        if scrolled:
+            if group.surface is None:
+                group.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0 if opaque else pygame.SRCALPHA)
+            # Translucent groups are built from premultiplied layers so the
+            # composite blends onto the screen exactly like the layers would
+            flags = 0 if opaque else pygame.BLEND_PREMULTIPLIED
+            if not opaque:
+                group.surface.fill((0, 0, 0, 0))
+            for layer, image in zip(group.layers, group.images):
+                group.surface.blit(image, (0, 0), layer.view_area(), special_flags=flags)
+                pushed += screen_area
+            group.offsets = offsets
+            self.recomposites += 1
+        screen.blit(group.surface, (0, 0), special_flags=0 if opaque else pygame.BLEND_PREMULTIPLIED)
+        return pushed, changed
@@ -0,0 +1,129 @@
+# balance_sweep.py - Batch simulator for difficulty and balance tuning
+"""
+Plays many headless games of main.py with its scripted bot (--bot), one game per worker
+process, over every combination of the given balance values. Each game gets its
+own seed; the same seeds are reused for every parameter set, so sets are compared
+on identical enemy spawns and boss attacks.
+
+Balance values are module-level constants bound when the game modules are
+imported, so each game runs in a fresh worker process (maxtasksperchild=1)
+that overrides them in constants.py first and then runs main.py with runpy.
+Games are independent, so throughput scales with --workers. Rows are written
+to the CSV as games finish, and a per-parameter-set summary is printed at the end.
+
+Example:
+    python balance_sweep.py --difficulty 0.8 1.0 1.2 --boss-health 80 100 --games 200
+"""
+import os
+import io
+import csv
+import sys
+import runpy
+import argparse
+import itertools
+import statistics
+import contextlib
+import multiprocessing
+import constants
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(REPO_ROOT, 'main.py')
+
+# Command line option -> constant it overrides. Config's default difficulty is
+# 'normal', so the difficulty multiplier is DIFFICULTY_NORMAL.
+PARAMETERS = {
+    'difficulty': 'DIFFICULTY_NORMAL',
+    'boss_health': 'BOSS_HEALTH',
+    'boss_shoot_delay': 'BOSS_SHOOT_DELAY',
+}
+RESULT_FIELDS = ('survival_s', 'died', 'score', 'damage_taken', 'ticks', 'error')
+
+def play_game(task):
+    """
+    Worker: one game with the given constant overrides. Returns a result row;
+    a game that raises is reported in its row's error column.
+    """
+    index, params, seed, max_ticks = task
+    row = dict(game=index, seed=seed, **params)
+    os.chdir(REPO_ROOT)  # main.py loads assets by relative path
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    for option, value in params.items():
+        setattr(constants, PARAMETERS[option], value)
+    constants.LOG_FILE = os.devnull  # Workers would otherwise all write game.log
+    sys.argv = [MAIN, '--headless', '--bot', '--seed', str(seed), '--ticks', str(max_ticks)]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = runpy.run_path(MAIN, run_name='__main__')
+    except Exception as error:
+        row.update(dict.fromkeys(RESULT_FIELDS, ''), error=f"{type(error).__name__}: {error}")
+        return row
+    ticks = game['timestep'].ticks
+    row.update(survival_s=round(ticks / constants.SIM_HZ, 2), died=int(game['game_state'] == 'game_over'),
+               score=game['score_system'].score, damage_taken=game['collision_manager'].damage_taken,
+               ticks=ticks, error='')
+    return row
+
+def summarize(rows, options):
+    """
+    Prints one line per parameter set: games played, deaths and mean/median
+    survival, mean score and mean damage taken. Errored games are only counted.
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(row[option] for option in options), []).append(row)
+    header = ''.join(f"{option:>17}" for option in options)
+    print(f"{header} {'games':>6} {'errors':>6} {'died %':>7} {'surv mean':>10} {'surv p50':>9} "
+          f"{'score':>9} {'damage':>8}")
+    for key in sorted(groups):
+        played = [row for row in groups[key] if not row['error']]
+        errors = len(groups[key]) - len(played)
+        values = ''.join(f"{value:>17}" for value in key)
+        if not played:
+            print(f"{values} {0:>6} {errors:>6}")
+            continue
+        survival = [row['survival_s'] for row in played]
+        print(f"{values} {len(played):>6} {errors:>6} "
+              f"{100 * sum(row['died'] for row in played) / len(played):>7.1f} "
+              f"{statistics.fmean(survival):>10.1f} {statistics.median(survival):>9.1f} "
+              f"{statistics.fmean(row['score'] for row in played):>9.0f} "
+              f"{statistics.fmean(row['damage_taken'] for row in played):>8.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--difficulty', type=float, nargs='+', default=[constants.DIFFICULTY_NORMAL])
+    parser.add_argument('--boss-health', type=int, nargs='+', default=[constants.BOSS_HEALTH])
+    parser.add_argument('--boss-shoot-delay', type=float, nargs='+', default=[constants.BOSS_SHOOT_DELAY],
+                        help="ms between boss attacks at level 1")
+    parser.add_argument('--games', type=int, default=100, help="Games (seeds) per parameter set")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the first game; the rest follow on")
+    parser.add_argument('--max-minutes', type=float, default=10, help="Game time before a surviving bot stops")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', default='balance-sweep.csv')
+    args = parser.parse_args()
+
+    options = list(PARAMETERS)
+    grid = [dict(zip(options, values)) for values in itertools.product(*(getattr(args, option) for option in options))]
+    max_ticks = int(args.max_minutes * 60 * constants.SIM_HZ)
+    tasks = [(index, params, seed, max_ticks) for index, (params, seed) in
+             enumerate(itertools.product(grid, range(args.seed, args.seed + args.games)))]
+    print(f"{len(tasks)} games: {len(grid)} parameter sets x {args.games} seeds on {args.workers} workers")
+
+    rows = []
+    with open(args.output, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['game', 'seed'] + options + list(RESULT_FIELDS))
+        writer.writeheader()
+        # A fresh process per game, since overrides must land before the game modules are imported
+        with multiprocessing.Pool(args.workers, maxtasksperchild=1) as pool:
+            for row in pool.imap_unordered(play_game, tasks):
+                writer.writerow(row)
+                f.flush()
+                rows.append(row)
+                if len(rows) % 100 == 0:
+                    print(f"{len(rows)}/{len(tasks)} games")
+    print(f"Wrote {args.output}")
+    summarize(rows, options)
+
+if __name__ == "__main__":
+    main()
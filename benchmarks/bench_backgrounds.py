@@ -0,0 +1,52 @@
+# bench_backgrounds.py - Benchmark for procedural background generation and caching
+"""
+Times generating the nebula and planet bitmaps from scratch and loading them
+back from the disk cache (the startup path on every launch after the first).
+A throwaway cache directory is used so the real cache is left untouched.
+Run from the repository root: python benchmarks/bench_backgrounds.py
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BACKGROUND_SEED
+from procedural import BitmapCache
+
+def time_call(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 3])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--width', type=int, default=SCREEN_WIDTH)
+    parser.add_argument('--height', type=int, default=SCREEN_HEIGHT)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='bg-cache-')
+    try:
+        print(f"{'kind':>8} {'level':>6} {'generate (ms)':>14} {'cache hit (ms)':>15} {'hit surface (ms)':>17}")
+        for kind in BitmapCache.GENERATORS:
+            for level in args.levels:
+                cache = BitmapCache(directory)
+                params = (kind, BACKGROUND_SEED, level, args.width, args.height)
+                generator = cache.GENERATORS[kind]
+                generate = time_call(lambda: generator(args.width, args.height, BACKGROUND_SEED, level), args.repeats)
+                cache.load(*params)  # Populate the cache
+                hit = time_call(lambda: cache.load(*params), args.repeats)
+                hit_surface = time_call(lambda: cache.surface(*params), args.repeats)
+                print(f"{kind:>8} {level:>6} {generate * 1000:>14.1f} {hit * 1000:>15.1f} {hit_surface * 1000:>17.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
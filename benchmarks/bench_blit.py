@@ -0,0 +1,92 @@
+# bench_blit.py - Benchmark for blit throughput of raw, converted and atlased images
+"""
+Saves a set of small sprites to PNG, loads them back the way ResourceLoader does
+and measures blits per second onto the display for:
+  raw        - pygame.image.load results as decoded
+  converted  - to_display_format copies (convert_alpha / convert + RLE colorkey)
+  atlased    - subsurfaces of SpriteAtlas pages built from the converted sprites
+Per-pixel-alpha sprites and colorkeyed sprites are measured separately; colorkeyed
+art is never atlased, so it has no atlased row.
+Uses the SDL dummy video driver unless another one is set.
+Run from the repository root: python benchmarks/bench_blit.py
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BLACK
+from resource_loader import to_display_format
+from sprite_atlas import SpriteAtlas
+
+def make_sprites(directory, count, colorkey, rng):
+    """
+    Draw count random sprites, save them as PNG and load them back.
+    """
+    sprites = []
+    for i in range(count):
+        size = rng.randrange(8, 48)
+        if colorkey:
+            sprite = pygame.Surface((size, size))
+            sprite.fill(COLOR_BLACK)
+            sprite.set_colorkey(COLOR_BLACK)
+        else:
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        color = (rng.randrange(60, 256), rng.randrange(60, 256), rng.randrange(60, 256), 255)
+        pygame.draw.circle(sprite, color, (size // 2, size // 2), size // 2)
+        path = os.path.join(directory, f"sprite{i}.png")
+        pygame.image.save(sprite, path)
+        loaded = pygame.image.load(path)
+        if colorkey and loaded.get_colorkey() is None:
+            loaded.set_colorkey(COLOR_BLACK)  # PNG colorkeys do not always survive saving
+        sprites.append(loaded)
+    return sprites
+
+def blits_per_second(screen, sprites, blits, repeats, rng):
+    positions = [(rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT)) for _ in range(blits)]
+    sequence = [(sprites[i % len(sprites)], pos) for i, pos in enumerate(positions)]
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        screen.blits(sequence, doreturn=False)
+        best = min(best, time.perf_counter() - start)
+    return blits / best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sprites', type=int, default=64)
+    parser.add_argument('--blits', type=int, default=20000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rng = random.Random(0)
+    directory = tempfile.mkdtemp(prefix='blit-bench-')
+    try:
+        print(f"display: {screen.get_bitsize()} bpp")
+        print(f"{'art':>9} {'surfaces':>10} {'blits/s':>12}")
+        for colorkey in (False, True):
+            art = 'colorkey' if colorkey else 'alpha'
+            raw = make_sprites(directory, args.sprites, colorkey, rng)
+            converted = [to_display_format(sprite) for sprite in raw]
+            variants = [('raw', raw), ('converted', converted)]
+            if not colorkey:
+                atlas = SpriteAtlas()
+                packed = atlas.pack({i: sprite for i, sprite in enumerate(converted)})
+                variants.append(('atlased', [packed[i] for i in range(len(converted))]))
+            for name, sprites in variants:
+                rate = blits_per_second(screen, sprites, args.blits, args.repeats, rng)
+                print(f"{art:>9} {name:>10} {rate:>12,.0f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# bench_collisions.py - Benchmark for CollisionManager strategies
+"""
+Times CollisionManager.handle_bullets_enemies and handle_enemy_bullets for each
+collision strategy with 100, 1,000 and 10,000 bullets. Before timing, every
+strategy is cross-checked against the plain pygame.sprite path on randomized
+scenes; any difference in hits or side effects aborts the run.
+Run from the repository root: python benchmarks/bench_collisions.py
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from collision_manager import CollisionManager
+
+class Box(pygame.sprite.Sprite):
+    """
+    Minimal bullet/enemy stand-in carrying the attributes CollisionManager reads.
+    """
+    def __init__(self, x, y, w, h, health=1, damage=1, score_value=10):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, w, h)
+        self.health = health
+        self.damage = damage
+        self.score_value = score_value
+
+class PlayerBox(Box):
+    def __init__(self, x, y):
+        super().__init__(x, y, 50, 40, health=10 ** 6)
+        self.invincible = False
+        self.collision_damage = 1
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+    def is_shielded(self):
+        return False
+
+class RecordingSink:
+    """
+    Records every side-effect call so strategies can be compared call by call.
+    """
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+
+    def __getattr__(self, method):
+        return lambda *args: self.log.append((self.name, method, args))
+
+def make_scene(num_bullets, num_enemies, seed, degenerate=False):
+    rng = random.Random(seed)
+    # Degenerate scenes add zero, negative and edge-touching sizes
+    sizes = range(-3, 12) if degenerate else range(4, 8)
+    enemies = pygame.sprite.Group(
+        Box(rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT // 2),
+            rng.choice(sizes) * 6, rng.choice(sizes) * 6, health=rng.randint(1, 4))
+        for _ in range(num_enemies)
+    )
+    bullets = pygame.sprite.Group(
+        Box(rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT),
+            rng.choice(sizes), rng.choice(sizes) * 2, damage=rng.randint(1, 2))
+        for _ in range(num_bullets)
+    )
+    player = PlayerBox(rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT))
+    return player, bullets, enemies
+
+def run_frame(strategy, scene):
+    player, bullets, enemies = scene
+    log = []
+    manager = CollisionManager(strategy=strategy)
+    particles, sound, score, achievements = (RecordingSink(log, name) for name in
+                                             ('particles', 'sound', 'score', 'achievements'))
+    manager.handle_player_enemies(player, enemies)
+    manager.handle_bullets_enemies(bullets, enemies)
+    manager.handle_enemy_bullets(player, bullets)
+    events = list(manager.events)
+    manager.dispatch(particles, sound, score, achievements)
+    survivors = ([tuple(s.rect) for s in bullets], [(tuple(s.rect), s.health) for s in enemies])
+    return events, log, player.health, survivors
+
+def verify(scenes):
+    """
+    Differential check: every strategy must match the pygame.sprite path exactly.
+    """
+    for seed in range(scenes):
+        params = (random.Random(seed).randint(0, 400), random.Random(-seed).randint(0, 60))
+        expected = run_frame('sprite', make_scene(*params, seed, degenerate=seed % 2 == 1))
+        for strategy in CollisionManager.STRATEGIES:
+            result = run_frame(strategy, make_scene(*params, seed, degenerate=seed % 2 == 1))
+            if result != expected:
+                sys.exit(f"Strategy {strategy} diverges from pygame.sprite on scene {seed}")
+    print(f"Verified {len(CollisionManager.STRATEGIES)} strategies on {scenes} randomized scenes")
+
+def time_handler(handler, strategy, num_bullets, num_enemies, repeats):
+    manager = CollisionManager(strategy=strategy)
+    best = float('inf')
+    for i in range(repeats):
+        player, bullets, enemies = make_scene(num_bullets, num_enemies, seed=i)
+        for enemy in enemies:
+            enemy.health = 10 ** 6
+        if handler == 'bullets_enemies':
+            args = (bullets, enemies)
+            call = manager.handle_bullets_enemies
+        else:
+            args = (player, bullets)
+            call = manager.handle_enemy_bullets
+        start = time.perf_counter()
+        call(*args)
+        best = min(best, time.perf_counter() - start)
+        manager.events.clear()
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--enemies', type=int, default=60)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--scenes', type=int, default=200, help="Randomized scenes to verify")
+    parser.add_argument('--bullets', type=int, nargs='+', default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    verify(args.scenes)
+    for handler in ('bullets_enemies', 'enemy_bullets'):
+        print(f"\nhandle_{handler}")
+        print(f"{'bullets':>8} " + " ".join(f"{s + ' (ms)':>20}" for s in CollisionManager.STRATEGIES))
+        for num_bullets in args.bullets:
+            timings = [time_handler(handler, s, num_bullets, args.enemies, args.repeats) * 1000
+                       for s in CollisionManager.STRATEGIES]
+            print(f"{num_bullets:>8} " + " ".join(f"{t:>20.3f}" for t in timings))
+
+if __name__ == "__main__":
+    main()
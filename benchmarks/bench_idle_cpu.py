@@ -0,0 +1,63 @@
+# bench_idle_cpu.py - Benchmark for CPU usage while idling in the main menu
+"""
+Runs the main menu with no input for a few seconds in two modes and reports
+process CPU time as a share of wall time:
+  spin - the old loop: poll events, redraw and flip every iteration, no frame cap
+  idle - the current loop: wait_events with IDLE_EVENT_TIMEOUT, redraw only when
+         the menu changed, clock.tick(IDLE_FPS)
+Uses the SDL dummy video driver unless another one is set.
+Run from the repository root: python benchmarks/bench_idle_cpu.py
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, IDLE_FPS, IDLE_EVENT_TIMEOUT
+from input_handler import InputHandler
+from menu import Menu
+
+def run(mode, seconds, screen):
+    menu = Menu(screen)
+    menu.options = ["Start", "Load", "Settings", "Highscores", "Quit"]
+    input_handler = InputHandler()
+    clock = pygame.time.Clock()
+    frames = 0
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    while time.perf_counter() - wall_start < seconds:
+        if mode == 'spin':
+            input_handler.handle_events()
+            menu.handle_selection(input_handler.get_keys())
+            menu.invalidate()  # The old menu redrew unconditionally
+            menu.draw()
+            pygame.display.flip()
+            frames += 1
+        else:
+            input_handler.wait_events(IDLE_EVENT_TIMEOUT)
+            menu.handle_selection(input_handler.get_keys())
+            if menu.draw():
+                pygame.display.flip()
+                frames += 1
+            clock.tick(IDLE_FPS)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return cpu / wall, frames / wall
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'mode':>6} {'cpu (% of one core)':>20} {'redraws/s':>10}")
+    for mode in ('spin', 'idle'):
+        cpu, redraws = run(mode, args.seconds, screen)
+        print(f"{mode:>6} {cpu * 100:>20.1f} {redraws:>10.1f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# cold_start.py - Stand-in startup for the cold_start scenario
+"""
+Replays main.py's startup up to the first menu frame with the objects that do
+not depend on the game's sprite classes: display, resource loader, background
+layers and compositor, particle system, collision manager, menus and the
+loading screen. Exits once the first menu frame is presented.
+Run from the repository root: python benchmarks/cold_start.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, IDLE_FPS
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    clock = pygame.time.Clock()
+    from resource_loader import ResourceLoader
+    resource_loader = ResourceLoader()
+    resource_loader.request_group("menu")
+
+    from background import Background, StarField, NebulaBackground, PlanetBackground, BackgroundCompositor
+    from particle import ParticleSystem
+    from collision_manager import CollisionManager
+    from effects import ScreenEffects
+    from menu import Menu, PauseMenu, SettingsMenu, HighScoreMenu, LoadingScreen
+    BackgroundCompositor([Background(), StarField(), NebulaBackground(), PlanetBackground()])
+    ParticleSystem()
+    CollisionManager()
+    ScreenEffects(screen)
+    menu = Menu(screen)
+    for menu_type in (PauseMenu, SettingsMenu, HighScoreMenu):
+        menu_type(screen)
+
+    resource_loader.request_group("gameplay")
+    resource_loader.load_font("default", 36)
+    resource_loader.load_font("small", 24)
+    loading_screen = LoadingScreen(screen)
+    while not resource_loader.is_ready("menu"):
+        pygame.event.pump()
+        loading_screen.draw(*resource_loader.progress("menu"))
+        pygame.display.flip()
+        clock.tick(IDLE_FPS)
+    resource_loader.convert_all()
+
+    menu.draw(screen)
+    pygame.display.flip()
+    resource_loader.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# run.py - Scenario benchmark suite for the game loop
+"""
+Runs the scripted scenarios in benchmarks/scenarios.py headless and reports
+per-frame p50/p95/p99 times and peak traced memory. Results are written as
+JSON so runs on different commits can be compared; with --baseline, any metric
+more than --threshold worse than the stored baseline is flagged and the run
+exits non-zero. A scenario that fails (for example because a game module is
+broken) is reported as an error and the rest still run.
+Peak memory comes from a separate tracemalloc pass, so it does not skew timings.
+Run from the repository root: python benchmarks/run.py
+"""
+import os
+import sys
+import json
+import platform
+import argparse
+import subprocess
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from scenarios import SCENARIOS, REPO_ROOT
+
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'peak_bytes')
+
+def git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True)
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+def run_scenario(scenario_type, screen, frames, memory_frames):
+    frames = frames or scenario_type.frames
+    result = {'frames': frames, 'error': None}
+    try:
+        scenario = scenario_type(screen)
+        times = np.array(scenario.run(frames)) * 1000
+        result.update(zip(('p50_ms', 'p95_ms', 'p99_ms'), np.percentile(times, (50, 95, 99)).round(3).tolist()))
+        result['mean_ms'] = round(float(times.mean()), 3)
+        result['peak_bytes'] = scenario.peak_bytes
+        if scenario_type.traced and memory_frames:
+            tracemalloc.start()
+            try:
+                scenario_type(screen).run(min(frames, memory_frames))
+                result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except Exception as error:
+        result['error'] = f"{type(error).__name__}: {error}"
+    return result
+
+def compare(results, baseline, threshold):
+    """
+    Returns (scenario, metric, baseline value, current value) for every metric
+    that got worse by more than threshold.
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get('scenarios', {}).get(name)
+        if result['error'] or not before or before.get('error'):
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if old and new is not None and new > old * (1 + threshold):
+                regressions.append((name, metric, old, new))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    names = [scenario.name for scenario in SCENARIOS]
+    parser.add_argument('--scenarios', nargs='+', choices=names, default=names)
+    parser.add_argument('--frames', type=int, help="Frames per scenario (default: each scenario's own)")
+    parser.add_argument('--memory-frames', type=int, default=60,
+                        help="Frames of the tracemalloc pass; 0 skips memory measurement")
+    parser.add_argument('--output', default='benchmark-results.json')
+    parser.add_argument('--baseline', help="Earlier results JSON to flag regressions against")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results = {}
+    print(f"{'scenario':>22} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} {'peak (KiB)':>11}")
+    for scenario_type in SCENARIOS:
+        if scenario_type.name not in args.scenarios:
+            continue
+        result = results[scenario_type.name] = run_scenario(scenario_type, screen, args.frames, args.memory_frames)
+        if result['error']:
+            print(f"{scenario_type.name:>22}  error: {result['error']}")
+        else:
+            peak = f"{result['peak_bytes'] / 1024:.0f}" if result['peak_bytes'] is not None else '-'
+            print(f"{scenario_type.name:>22} {result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f} "
+                  f"{result['p99_ms']:>9.3f} {peak:>11}")
+    pygame.quit()
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'scenarios': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (commit {baseline.get('commit')})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+# scenarios.py - Scripted game-loop scenarios for benchmarks/run.py
+"""
+Each scenario builds a scene in setup() and advances it one frame per frame()
+call: update, collisions and drawing, as the playing state of main.py does.
+Game modules are imported in setup(), so a scenario whose modules are broken
+fails on its own and the rest of the suite still runs.
+"""
+import os
+import sys
+import time
+import subprocess
+import numpy as np
+import pygame
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Scenario:
+    """
+    Base scenario. run() times every frame; scenarios that measure something
+    other than in-process frames override it. peak_bytes may be set by run()
+    for memory the suite cannot trace itself.
+    """
+    name = None
+    frames = 300
+    traced = True  # Whether tracemalloc sees this scenario's memory
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.peak_bytes = None
+
+    def setup(self):
+        pass
+
+    def frame(self):
+        raise NotImplementedError
+
+    def run(self, frames):
+        self.setup()
+        times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            self.frame()
+            times.append(time.perf_counter() - start)
+        return times
+
+class StandInPlayer(pygame.sprite.Sprite):
+    """
+    Player-shaped box with the attributes CollisionManager reads. It never dies.
+    """
+    def __init__(self, screen):
+        super().__init__()
+        self.image = pygame.Surface((50, 40)).convert()
+        self.image.fill((0, 255, 0))
+        self.rect = self.image.get_rect(midbottom=(screen.get_width() // 2, screen.get_height() - 10))
+        self.health = 10 ** 9
+        self.invincible = False
+        self.collision_damage = 1
+
+    def take_damage(self, damage):
+        self.health -= damage
+
+    def is_shielded(self):
+        return False
+
+class StandInBullet(pygame.sprite.Sprite):
+    """
+    Bullet that flies straight at angle degrees from straight down and dies off screen.
+    """
+    def __init__(self, x, y, angle=0.0, size=(4, 10)):
+        super().__init__()
+        from constants import BULLET_SPEED, BULLET_DAMAGE, COLOR_RED
+        self.image = pygame.Surface(size)
+        self.image.fill(COLOR_RED)
+        self.rect = self.image.get_rect(center=(x, y))
+        self.vx = BULLET_SPEED * float(np.sin(np.radians(angle)))
+        self.vy = BULLET_SPEED * float(np.cos(np.radians(angle)))
+        self.x, self.y = float(self.rect.x), float(self.rect.y)
+        self.damage = BULLET_DAMAGE
+
+    def update(self):
+        self.x += self.vx
+        self.y += self.vy
+        self.rect.topleft = (int(self.x), int(self.y))
+        if not pygame.display.get_surface().get_rect().colliderect(self.rect):
+            self.kill()
+
+class StandInEnemy(pygame.sprite.Sprite):
+    """
+    Enemy-shaped box that sweeps sideways, bouncing off the screen edges, and
+    fires one StandInBullet every shoot_delay ms of game time.
+    """
+    size = (20, 12)
+    shoot_delay = 1500
+
+    def __init__(self, x, y):
+        super().__init__()
+        from constants import ENEMY_SPEED
+        from game_clock import game_clock
+        from rng import rng
+        self.image = pygame.Surface(self.size)
+        self.image.fill((200, 60, 60))
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.speed = ENEMY_SPEED
+        self.direction = 1
+        self.health = 10 ** 6
+        self.damage = 1
+        self.score_value = 10
+        self.clock = game_clock
+        self.random = rng.gameplay
+        # Staggered so a horde does not fire in volleys
+        self.last_shot = game_clock.get_ticks() - self.random.randrange(int(self.shoot_delay))
+
+    def update(self, enemy_bullets, player, difficulty, effects):
+        self.rect.x += self.speed * self.direction * difficulty
+        if self.rect.left < 0 or self.rect.right > pygame.display.get_surface().get_width():
+            self.direction *= -1
+        now = self.clock.get_ticks()
+        if now - self.last_shot > self.shoot_delay:
+            self.last_shot = now
+            self.attack(enemy_bullets, player)
+
+    def attack(self, enemy_bullets, player):
+        enemy_bullets.add(StandInBullet(self.rect.centerx, self.rect.bottom))
+
+class StandInBoss(StandInEnemy):
+    """
+    Final-boss-sized enemy with the final boss's attack mix: a three-shot
+    volley, an aimed shot, a three-way spread and a laser, one picked at random
+    every BOSS_SHOOT_DELAY / MAX_LEVEL ms.
+    """
+    size = (100, 100)
+
+    def __init__(self, x, y):
+        from constants import BOSS_SHOOT_DELAY, MAX_LEVEL
+        self.shoot_delay = BOSS_SHOOT_DELAY / MAX_LEVEL
+        super().__init__(x, y)
+        self.attacks = (self.volley, self.aimed, self.spread, self.laser)
+
+    def attack(self, enemy_bullets, player):
+        self.random.choice(self.attacks)(enemy_bullets, player)
+
+    def volley(self, enemy_bullets, player):
+        enemy_bullets.add(StandInBullet(self.rect.centerx + dx, self.rect.bottom) for dx in (-20, 0, 20))
+
+    def aimed(self, enemy_bullets, player):
+        dx, dy = player.rect.centerx - self.rect.centerx, player.rect.centery - self.rect.bottom
+        enemy_bullets.add(StandInBullet(self.rect.centerx, self.rect.bottom, np.degrees(np.arctan2(dx, dy)), (8, 8)))
+
+    def spread(self, enemy_bullets, player):
+        enemy_bullets.add(StandInBullet(self.rect.centerx, self.rect.bottom, angle, (6, 6)) for angle in (-30, 0, 30))
+
+    def laser(self, enemy_bullets, player):
+        enemy_bullets.add(StandInBullet(self.rect.centerx, self.rect.bottom, size=(4, 30)))
+
+class GameScene(Scenario):
+    """
+    Shared pieces of an in-game scene: a stand-in player, groups, collisions,
+    effects and the game clock. Enemies, bosses and bullets are stand-ins too,
+    so the scenes time the loop's groups, collisions and drawing on fixed,
+    comparable workloads that do not depend on the game's sprite classes.
+    """
+    def setup(self):
+        from collision_manager import CollisionManager
+        from effects import ScreenEffects
+        from game_clock import game_clock
+        from rng import rng
+        rng.reseed(0)
+        self.clock = game_clock
+        self.player = StandInPlayer(self.screen)
+        self.enemies = pygame.sprite.Group()
+        self.enemy_bullets = pygame.sprite.Group()
+        self.collisions = CollisionManager()
+        self.effects = ScreenEffects(self.screen)
+
+    def draw(self, *groups):
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.player.image, self.player.rect)
+        for group in groups:
+            group.draw(self.screen)
+        pygame.display.flip()
+
+class EnemyHorde(GameScene):
+    name = 'enemies_1000'
+
+    def setup(self):
+        super().setup()
+        for i in range(1000):
+            self.enemies.add(StandInEnemy(i % 40 * 20, i // 40 * 12))
+
+    def frame(self):
+        self.clock.tick()
+        self.enemies.update(self.enemy_bullets, self.player, 1.0, self.effects)
+        self.enemy_bullets.update()
+        self.collisions.handle_player_enemies(self.player, self.enemies)
+        self.collisions.events.clear()
+        self.draw(self.enemies, self.enemy_bullets)
+
+class ParticleStorm(Scenario):
+    name = 'particle_storm_10000'
+
+    def setup(self):
+        from particle import ParticleSystem
+        from rng import rng
+        rng.reseed(0)
+        self.particles = ParticleSystem(capacity=10000)
+        self.rng = rng.numpy('cosmetic')
+
+    def frame(self):
+        # Keep the system topped up with fresh explosions all over the screen
+        while len(self.particles) < 9900:
+            x, y = self.rng.integers(0, (self.screen.get_width(), self.screen.get_height()))
+            self.particles.add_explosion((int(x), int(y)))
+        self.particles.update()
+        self.screen.fill((0, 0, 0))
+        self.particles.draw(self.screen)
+        pygame.display.flip()
+
+class FinalBossFight(GameScene):
+    name = 'final_boss'
+
+    def setup(self):
+        super().setup()
+        self.boss = StandInBoss(self.screen.get_width() // 2 - 50, 50)
+        self.enemies.add(self.boss)
+
+    def frame(self):
+        self.clock.tick()
+        self.enemies.update(self.enemy_bullets, self.player, 1.0, self.effects)
+        self.enemy_bullets.update()
+        self.collisions.handle_enemy_bullets(self.player, self.enemy_bullets)
+        self.collisions.events.clear()
+        self.draw(self.enemies, self.enemy_bullets)
+
+class EnemyBulletSwarm(GameScene):
+    name = 'enemy_bullets_5000'
+    count = 5000
+
+    def setup(self):
+        super().setup()
+        from rng import rng
+        self.bullet_type = StandInBullet
+        self.rng = rng.gameplay
+
+    def frame(self):
+        # Bullets that left the screen or hit the player are replaced
+        width, height = self.screen.get_size()
+        while len(self.enemy_bullets) < self.count:
+            self.enemy_bullets.add(self.bullet_type(self.rng.randrange(width), self.rng.randrange(height)))
+        self.enemy_bullets.update()
+        self.collisions.handle_enemy_bullets(self.player, self.enemy_bullets)
+        self.collisions.events.clear()
+        self.draw(self.enemy_bullets)
+
+class PooledBulletSwarm(GameScene):
+    """
+    EnemyBulletSwarm at twice the count, on the pooled bullet manager.
+    """
+    name = 'bullet_pool_10000'
+    count = 10000
+
+    def setup(self):
+        super().setup()
+        from bullet_manager import BulletManager, SPREAD_SHOT
+        from rng import rng
+        self.enemy_bullets = BulletManager()
+        self.kind = SPREAD_SHOT
+        self.rng = rng.numpy('gameplay')
+
+    def frame(self):
+        width, height = self.screen.get_size()
+        missing = self.count - len(self.enemy_bullets)
+        if missing > 0:
+            self.enemy_bullets.fire(self.kind, self.rng.uniform(0, width, missing),
+                                    self.rng.uniform(0, height, missing), angle=self.rng.uniform(-45, 45, missing))
+        self.clock.tick()
+        self.enemy_bullets.update()
+        self.collisions.handle_enemy_bullets(self.player, self.enemy_bullets)
+        self.collisions.events.clear()
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.player.image, self.player.rect)
+        self.enemy_bullets.draw(self.screen)
+        pygame.display.flip()
+
+class EntityStoreHorde(GameScene):
+    """
+    EnemyHorde's workload at ten times the count, on the entity store backend,
+    with a steady stream of player bullets.
+    """
+    name = 'entity_store_10000'
+    count = 10000
+
+    def setup(self):
+        super().setup()
+        import entity_store
+        from rng import rng
+        self.systems = entity_store
+        self.store = entity_store.EntityStore()
+        self.rng = rng.numpy('gameplay')
+        self.enemy_image = pygame.Surface((20, 12)).convert()
+        self.bullet_image = pygame.Surface((4, 10)).convert()
+
+    def frame(self):
+        width, height = self.screen.get_size()
+        missing = self.count - len(self.store)
+        if missing > 0:
+            pos = self.rng.uniform((0, -90), (width, height), (missing, 2))
+            self.store.spawn(self.systems.ENEMY, pos, (0, 2), self.enemy_image, health=20, damage=5, score_value=10)
+        pos = np.column_stack((self.rng.uniform(0, width, 20), np.full(20, height - 40)))
+        self.store.spawn(self.systems.PLAYER_BULLET, pos, (0, -7), self.bullet_image, damage=10)
+        self.clock.tick()
+        self.systems.movement_system(self.store)
+        self.systems.cull_system(self.store, self.screen.get_rect())
+        self.collisions.handle_entities(self.player, self.store, ())
+        self.collisions.events.clear()
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.player.image, self.player.rect)
+        self.systems.render_system(self.store, self.screen)
+        pygame.display.flip()
+
+class ColdStart(Scenario):
+    """
+    Launches benchmarks/cold_start.py, main.py's startup with stand-ins for the
+    player, enemies and UI, in a fresh interpreter; each "frame" is one launch,
+    from process start to the first menu frame being presented.
+    """
+    name = 'cold_start'
+    frames = 5
+    traced = False
+
+    def run(self, frames):
+        env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+        times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, os.path.join('benchmarks', 'cold_start.py')], cwd=REPO_ROOT, env=env,
+                                    capture_output=True, text=True)
+            times.append(time.perf_counter() - start)
+            if result.returncode != 0:
+                lines = result.stderr.strip().splitlines()
+                raise RuntimeError(lines[-1] if lines else f"cold_start.py exited with {result.returncode}")
+        try:
+            import resource
+            # ru_maxrss is in KiB on Linux; it covers the largest child so far
+            self.peak_bytes = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
+        except ImportError:
+            pass
+        return times
+
+SCENARIOS = (EnemyHorde, ParticleStorm, FinalBossFight, EnemyBulletSwarm, PooledBulletSwarm, EntityStoreHorde, ColdStart)
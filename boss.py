@@ -1,12 +1,15 @@
 # boss.py - Expanded bosses with multiple phases and attacks
 import pygame
-import random
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SPEED, BOSS_HEALTH, COLOR_RED
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SPEED, BOSS_HEALTH, MINI_BOSS_HEALTH, BOSS_SHOOT_DELAY, MAX_LEVEL, COLOR_RED
+from game_clock import game_clock
+from rng import rng
 from bullet import EnemyBullet, HomingBullet, LaserBullet, SpreadBullet
+from bullet_manager import ENEMY_SHOT, HOMING_SHOT, LASER_SHOT, SPREAD_SHOT
 
 class Boss(pygame.sprite.Sprite):
     """
-    Base boss class with phases.
+    Base boss class with phases. Attacks fire into a BulletManager pool when
+    enemy_bullets is one (anything with fire()), otherwise they add sprites.
     """
     def __init__(self, level):
         super().__init__()
@@ -17,8 +20,8 @@ class Boss(pygame.sprite.Sprite):
         self.rect.y = 50
         self.health = BOSS_HEALTH * level
         self.max_health = self.health
-        self.shoot_delay = 500 / level
-        self.last_shot = pygame.time.get_ticks()
+        self.shoot_delay = BOSS_SHOOT_DELAY / level
+        self.last_shot = game_clock.get_ticks()
         self.direction = 1
         self.phase = 1
         self.damage = 20
@@ -37,22 +40,32 @@ class Boss(pygame.sprite.Sprite):
             self.phase = 3
             self.attacks.append(self.ultimate_attack)
 
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_shot > self.shoot_delay:
-            attack = random.choice(self.attacks)
+            attack = rng.gameplay.choice(self.attacks)
             attack(enemy_bullets, player)
             self.last_shot = now
 
     def basic_attack(self, enemy_bullets, player):
+        if hasattr(enemy_bullets, 'fire'):
+            enemy_bullets.fire(ENEMY_SHOT, (self.rect.centerx - 20, self.rect.centerx, self.rect.centerx + 20),
+                               self.rect.bottom)
+            return
         for i in range(3):
             bullet = EnemyBullet(self.rect.centerx + i*20 - 20, self.rect.bottom)
             enemy_bullets.add(bullet)
 
     def advanced_attack(self, enemy_bullets, player):
+        if hasattr(enemy_bullets, 'fire'):
+            enemy_bullets.fire(HOMING_SHOT, self.rect.centerx, self.rect.bottom, target=player)
+            return
         bullet = HomingBullet(self.rect.centerx, self.rect.bottom, player)
         enemy_bullets.add(bullet)
 
     def ultimate_attack(self, enemy_bullets, player):
+        if hasattr(enemy_bullets, 'fire'):
+            enemy_bullets.fire(SPREAD_SHOT, self.rect.centerx, self.rect.bottom, angle=(-30, 0, 30))
+            return
         for angle in [-30, 0, 30]:
             bullet = SpreadBullet(self.rect.centerx, self.rect.bottom, 'down', angle)
             enemy_bullets.add(bullet)
@@ -76,5 +89,8 @@ class FinalBoss(Boss):
         self.attacks.append(self.laser_sweep)
 
     def laser_sweep(self, enemy_bullets, player):
+        if hasattr(enemy_bullets, 'fire'):
+            enemy_bullets.fire(LASER_SHOT, self.rect.centerx, self.rect.bottom)
+            return
         bullet = LaserBullet(self.rect.centerx, self.rect.bottom, 'down')
         enemy_bullets.add(bullet)
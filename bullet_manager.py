@@ -0,0 +1,189 @@
+# bullet_manager.py - New module for pooled bullets
+import itertools
+import numpy as np
+import pygame
+from constants import (
+    MAX_BULLETS, BULLET_SPEED, BULLET_DAMAGE, BULLET_CULL_MARGIN, HOMING_TURN_RATE,
+    SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_RED, COLOR_ORANGE, COLOR_CYAN, COLOR_YELLOW, COLOR_WHITE
+)
+
+# Who fired a bullet, stored per slot in the owner column
+PLAYER_OWNER, ENEMY_OWNER = range(2)
+
+class BulletKind:
+    """
+    Look and behavior shared by every bullet of one kind. Its image is built
+    once and shared by all of them.
+    """
+    def __init__(self, size, color, speed, damage, homing=False):
+        self.size = size
+        self.color = color
+        self.speed = speed
+        self.damage = damage
+        self.homing = homing
+
+    def image(self):
+        image = pygame.Surface(self.size)
+        image.fill(self.color)
+        return image.convert() if pygame.display.get_surface() is not None else image
+
+# Kind index -> BulletKind; the index is what BulletManager stores per bullet.
+# Speed and damage match the sprite bullets, which all use BULLET_SPEED and BULLET_DAMAGE.
+BULLET_KINDS = (
+    BulletKind((4, 10), COLOR_RED, BULLET_SPEED, BULLET_DAMAGE),
+    BulletKind((8, 8), COLOR_ORANGE, BULLET_SPEED, BULLET_DAMAGE, homing=True),
+    BulletKind((4, 30), COLOR_CYAN, BULLET_SPEED, BULLET_DAMAGE),
+    BulletKind((6, 6), COLOR_YELLOW, BULLET_SPEED, BULLET_DAMAGE),
+    BulletKind((4, 10), COLOR_WHITE, BULLET_SPEED, BULLET_DAMAGE),
+)
+ENEMY_SHOT, HOMING_SHOT, LASER_SHOT, SPREAD_SHOT, PLAYER_SHOT = range(len(BULLET_KINDS))
+# Sprite bullet class name -> kind, for bullets handed to BulletManager.add.
+# Names rather than classes keep this module importable without bullet.py.
+SPRITE_KINDS = {'EnemyBullet': ENEMY_SHOT, 'HomingBullet': HOMING_SHOT, 'LaserBullet': LASER_SHOT,
+                'SpreadBullet': SPREAD_SHOT, 'PlayerBullet': PLAYER_SHOT}
+
+class BulletManager:
+    """
+    Fixed pool of bullet slots in NumPy columns. Firing takes slots from a free
+    list and recycling a bullet puts its slot back, so nothing is allocated per
+    shot. update() moves every slot, steers homing bullets and recycles the
+    ones that left the screen in a few whole-array steps; draw() blits all live
+    bullets from cached per-kind images in one Surface.blits call.
+    It stands in for the enemy bullet group: add() takes sprite bullets fired
+    by enemies that do not know about the pool and turns each into the shot
+    of its kind, keeping its angle, homing target and damage.
+    """
+    def __init__(self, capacity=MAX_BULLETS, bounds=(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)  # Centers
+        self.previous = np.zeros((capacity, 2), dtype=np.float32)  # Centers before the last update
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Free slots form a stack: free[:free_count] can be handed out
+        self.free = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self.free_count = capacity
+        self.dropped = 0
+        self.target = None  # Sprite homing bullets steer toward
+        self.area = pygame.Rect(bounds).inflate(2 * BULLET_CULL_MARGIN, 2 * BULLET_CULL_MARGIN)
+        # Per-kind lookup tables indexed by the kind column
+        self._speed = np.array([k.speed for k in BULLET_KINDS], dtype=np.float32)
+        self._half = np.array([k.size for k in BULLET_KINDS], dtype=np.float32) / 2
+        self._homing = np.array([k.homing for k in BULLET_KINDS])
+        self._images = None
+
+    def __len__(self):
+        return self.capacity - self.free_count
+
+    def empty(self):
+        self.alive[:] = False
+        self.free[:] = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self.free_count = self.capacity
+
+    def fire(self, kind, x, y, angle=0.0, owner=ENEMY_OWNER, target=None):
+        """
+        Fire bullets of one kind from x, y (scalars or arrays, broadcast
+        together with angle). angle is in degrees from straight ahead: down for
+        enemies, up for the player. Bullets beyond capacity are dropped and
+        counted. Returns the slots used.
+        """
+        x, y, angle = np.broadcast_arrays(np.asarray(x, dtype=np.float32), np.asarray(y, dtype=np.float32),
+                                          np.radians(np.asarray(angle, dtype=np.float32)))
+        n = x.size
+        taken = min(n, self.free_count)
+        self.dropped += n - taken
+        if taken == 0:
+            return self.free[:0]
+        slots = self.free[self.free_count - taken:self.free_count].copy()
+        self.free_count -= taken
+        ahead = 1 if owner == ENEMY_OWNER else -1
+        speed = self._speed[kind]
+        self.pos[slots, 0] = x.ravel()[:taken]
+        self.pos[slots, 1] = y.ravel()[:taken]
+        self.previous[slots] = self.pos[slots]
+        self.vel[slots, 0] = np.sin(angle.ravel()[:taken]) * speed
+        self.vel[slots, 1] = np.cos(angle.ravel()[:taken]) * speed * ahead
+        self.kind[slots] = kind
+        self.damage[slots] = BULLET_KINDS[kind].damage
+        self.owner[slots] = owner
+        self.alive[slots] = True
+        if target is not None:
+            self.target = target
+        return slots
+
+    def add(self, *bullets):
+        for bullet in bullets:
+            kind = SPRITE_KINDS.get(type(bullet).__name__, ENEMY_SHOT)
+            owner = PLAYER_OWNER if kind == PLAYER_SHOT else ENEMY_OWNER
+            slots = self.fire(kind, *bullet.rect.center, angle=getattr(bullet, 'angle', 0.0), owner=owner,
+                              target=getattr(bullet, 'target', None))
+            if hasattr(bullet, 'damage'):
+                self.damage[slots] = bullet.damage
+
+    def recycle(self, slots):
+        """
+        Return live slots to the free list.
+        """
+        slots = slots[self.alive[slots]]
+        self.alive[slots] = False
+        self.free[self.free_count:self.free_count + len(slots)] = slots
+        self.free_count += len(slots)
+
+    def update(self):
+        self.previous[:] = self.pos
+        if self.target is not None:
+            homing = np.flatnonzero(self.alive & self._homing[self.kind])
+            if len(homing):
+                # Turn part of the way toward the target each tick, keeping speed
+                offset = np.array(self.target.rect.center, dtype=np.float32) - self.pos[homing]
+                distance = np.maximum(np.hypot(offset[:, 0], offset[:, 1]), 1e-6)
+                wanted = offset * (self._speed[self.kind[homing]] / distance)[:, None]
+                self.vel[homing] += (wanted - self.vel[homing]) * HOMING_TURN_RATE
+        self.pos += self.vel  # Dead slots move too; that is cheaper than masking them out
+        x, y = self.pos[:, 0], self.pos[:, 1]
+        area = self.area
+        gone = self.alive & ((x < area.left) | (x >= area.right) | (y < area.top) | (y >= area.bottom))
+        if gone.any():
+            self.recycle(np.flatnonzero(gone))
+
+    def hit(self, rect, owner=ENEMY_OWNER):
+        """
+        Recycle the live bullets of owner overlapping rect and return their damage values.
+        """
+        half = self._half[self.kind]
+        left, top = self.pos[:, 0] - half[:, 0], self.pos[:, 1] - half[:, 1]
+        right, bottom = self.pos[:, 0] + half[:, 0], self.pos[:, 1] + half[:, 1]
+        hits = np.flatnonzero(self.alive & (self.owner == owner) &
+                              (left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top))
+        damage = self.damage[hits]
+        self.recycle(hits)
+        return damage
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Blit every live bullet between its last two positions (alpha as for
+        Interpolator.draw). Returns the bounding rect of everything drawn.
+        """
+        live = np.flatnonzero(self.alive)
+        if len(live) == 0:
+            return []
+        if self._images is None:
+            self._images = [kind.image() for kind in BULLET_KINDS]
+        # Sorted by kind, each kind's run pairs one repeated image with its
+        # positions, so no per-bullet image list is built
+        live = live[np.argsort(self.kind[live], kind='stable')]
+        kinds = self.kind[live]
+        half = self._half[kinds]
+        previous = self.previous[live]
+        topleft = (previous + (self.pos[live] - previous) * alpha - half).astype(np.int32)
+        # Flat coordinate lists zipped into pairs are much cheaper than a nested tolist()
+        positions = list(zip(topleft[:, 0].tolist(), topleft[:, 1].tolist()))
+        ends = np.cumsum(np.bincount(kinds, minlength=len(BULLET_KINDS))).tolist()
+        runs = [zip(itertools.repeat(image), positions[start:end])
+                for image, start, end in zip(self._images, [0] + ends, ends) if end > start]
+        screen.blits(itertools.chain.from_iterable(runs), doreturn=False)
+        left, top = topleft.min(axis=0).tolist()
+        right, bottom = (topleft + 2 * half).max(axis=0).astype(np.int32).tolist()
+        return pygame.Rect(left, top, right - left, bottom - top).clip(screen.get_rect())
@@ -1,48 +1,199 @@
 # collision_manager.py - New module for collisions
+import numpy as np
 import pygame.sprite
+from constants import COLLISION_CELL_SIZE, EXPLOSION_MERGE_RADIUS
+from spatial_hash import SpatialHash
+from collision_kernel import rect_array, hit_pairs
+from entity_store import damage_system
+
+# Hit events queued by the handlers as (kind, pos, score value, achievement)
+HIT_EVENT, KILL_EVENT, IMPACT_EVENT, POWERUP_EVENT = range(4)
+EVENT_SOUNDS = {HIT_EVENT: 'hit', KILL_EVENT: 'explosion', IMPACT_EVENT: None, POWERUP_EVENT: 'powerup'}
+
+def merge_positions(positions, radius):
+    """
+    Collapse positions closer than radius to the first position of a group into
+    that group's centroid. Each position joins the earliest group whose first
+    position is in range, so groups keep the order in which they were started.
+    """
+    if radius <= 0:
+        return positions
+    groups = []
+    limit = radius * radius
+    for x, y in positions:
+        for group in groups:
+            if (x - group[0]) ** 2 + (y - group[1]) ** 2 < limit:
+                group[2] += x
+                group[3] += y
+                group[4] += 1
+                break
+        else:
+            groups.append([x, y, x, y, 1])
+    return [(sx // n, sy // n) for _, _, sx, sy, n in groups]
 
 class CollisionManager:
     """
     Handles all collisions.
+    strategy selects the detection path for every handler: 'vectorized'
+    (default) tests all rects at once, with NumPy arrays for group-vs-group and
+    Rect.collidelistall for one sprite against a group; 'spatial_hash' rebuilds
+    a uniform grid over the target group on each query; 'sprite' uses the plain
+    pygame.sprite helpers. Rebuilding the grid costs more than one linear pass,
+    so it only pays off when many bullets meet many enemies; main.py switches
+    to it by entity count (SPATIAL_HASH_MIN_PAIRS). All of them produce the
+    same hits in the same order.
+    Handlers resolve damage and kills immediately but only queue the sound,
+    particle, score and achievement side effects; call dispatch() once per
+    frame after the handlers to apply them. damage_taken totals the damage
+    dealt to the player since the manager was created or last reset.
     """
-    def handle_player_enemies(self, player, enemies, particles, sound, score, achievements):
-        hits = pygame.sprite.spritecollide(player, enemies, False)
+    STRATEGIES = ('sprite', 'spatial_hash', 'vectorized')
+
+    def __init__(self, strategy='vectorized', cell_size=COLLISION_CELL_SIZE,
+                 merge_radius=EXPLOSION_MERGE_RADIUS):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown collision strategy: {strategy}")
+        self.strategy = strategy
+        self.grid = SpatialHash(cell_size)
+        self.merge_radius = merge_radius
+        self.events = []
+        self.damage_taken = 0
+
+    def spritecollide(self, sprite, group, dokill):
+        if self.strategy == 'sprite':
+            return pygame.sprite.spritecollide(sprite, group, dokill)
+        sprites = group.sprites()
+        if self.strategy == 'spatial_hash':
+            self.grid.rebuild(sprites)
+            hits = self.grid.collide(sprite.rect)
+        else:
+            hits = [sprites[i] for i in sprite.rect.collidelistall([s.rect for s in sprites])]
+        if dokill:
+            for hit in hits:
+                hit.kill()
+        return hits
+
+    def groupcollide(self, groupa, groupb, dokilla):
+        if self.strategy == 'sprite':
+            return pygame.sprite.groupcollide(groupa, groupb, dokilla, False)
+        if self.strategy == 'vectorized':
+            return self._groupcollide_vectorized(groupa, groupb, dokilla)
+        self.grid.rebuild(groupb)
+        crashed = {}
+        for sprite in groupa.sprites():
+            hits = self.grid.collide(sprite.rect)
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+        return crashed
+
+    def _groupcollide_vectorized(self, groupa, groupb, dokilla):
+        sprites_a, sprites_b = groupa.sprites(), groupb.sprites()
+        rows, cols = hit_pairs(rect_array(sprites_a), rect_array(sprites_b))
+        crashed = {}
+        if len(rows) == 0:
+            return crashed
+        # Pairs come sorted by row, so each run of equal rows is one sprite's hit list
+        starts = np.flatnonzero(np.diff(rows, prepend=-1))
+        for row, hit_cols in zip(rows[starts].tolist(), np.split(cols, starts[1:])):
+            sprite = sprites_a[row]
+            crashed[sprite] = [sprites_b[i] for i in hit_cols.tolist()]
+            if dokilla:
+                sprite.kill()
+        return crashed
+
+    def handle_player_enemies(self, player, enemies):
+        hits = self.spritecollide(player, enemies, False)
         for hit in hits:
             if not player.invincible:
                 player.take_damage(hit.damage)
-                sound.play('hit')
+                self.damage_taken += hit.damage
+                self.events.append((HIT_EVENT, None, 0, None))
             hit.health -= player.collision_damage
             if hit.health <= 0:
                 hit.kill()
-                score.add_score(hit.score_value)
-                particles.add_explosion(hit.rect.center)
-                sound.play('explosion')
-                achievements.check_achievement('enemy_kill')
+                self.events.append((KILL_EVENT, hit.rect.center, hit.score_value, 'enemy_kill'))
 
-    def handle_bullets_enemies(self, bullets, enemies, particles, sound, score, achievements):
-        hits = pygame.sprite.groupcollide(bullets, enemies, True, False)
+    def handle_bullets_enemies(self, bullets, enemies):
+        hits = self.groupcollide(bullets, enemies, True)
         for bullet, enemy_hits in hits.items():
             for enemy in enemy_hits:
                 enemy.health -= bullet.damage
                 if enemy.health <= 0:
                     enemy.kill()
-                    score.add_score(enemy.score_value)
-                    particles.add_explosion(enemy.rect.center)
-                    sound.play('explosion')
-                    achievements.check_achievement('bullet_kill')
+                    self.events.append((KILL_EVENT, enemy.rect.center, enemy.score_value, 'bullet_kill'))
                 else:
-                    particles.add_impact(enemy.rect.center)
+                    self.events.append((IMPACT_EVENT, enemy.rect.center, 0, None))
 
-    def handle_powerups(self, player, powerups, sound, achievements):
-        hits = pygame.sprite.spritecollide(player, powerups, True)
+    def handle_powerups(self, player, powerups):
+        hits = self.spritecollide(player, powerups, True)
         for powerup in hits:
             powerup.apply(player)
-            sound.play('powerup')
-            achievements.check_achievement('powerup_collect')
+            self.events.append((POWERUP_EVENT, None, 0, 'powerup_collect'))
 
-    def handle_enemy_bullets(self, player, bullets, sound):
-        hits = pygame.sprite.spritecollide(player, bullets, True)
-        for bullet in hits:
+    def handle_enemy_bullets(self, player, bullets):
+        if hasattr(bullets, 'hit'):
+            # A BulletManager pool tests all its slots at once
+            damages = bullets.hit(player.rect).tolist()
+        else:
+            damages = [bullet.damage for bullet in self.spritecollide(player, bullets, True)]
+        for damage in damages:
             if not player.is_shielded():
-                player.take_damage(bullet.damage)
-                sound.play('hit')
+                player.take_damage(damage)
+                self.damage_taken += damage
+                self.events.append((HIT_EVENT, None, 0, None))
+
+    def handle_entities(self, player, store, player_bullets):
+        """
+        Hits involving the entity store, resolved by its damage system and
+        queued like the sprite handlers' hits.
+        """
+        damage, kills, impacts, collected = damage_system(store, player, player_bullets)
+        if damage:
+            player.take_damage(damage)
+            self.damage_taken += damage
+            self.events.append((HIT_EVENT, None, 0, None))
+        for center, score_value, rammed in kills:
+            # Tagged like the sprite handlers, which count ramming kills as 'enemy_kill'
+            self.events.append((KILL_EVENT, center, score_value, 'enemy_kill' if rammed else 'bullet_kill'))
+        for center in impacts:
+            self.events.append((IMPACT_EVENT, center, 0, None))
+        for powerup in collected:
+            if powerup is not None:
+                powerup.apply(player)
+            self.events.append((POWERUP_EVENT, None, 0, 'powerup_collect'))
+
+    def dispatch(self, particles, sound, score, achievements):
+        """
+        Apply this frame's queued hit events in one coalesced pass: each sound
+        plays at most once, explosions and impacts within EXPLOSION_MERGE_RADIUS
+        of each other become one effect, and score/achievement updates are batched.
+        """
+        if not self.events:
+            return
+        sounds = {}
+        explosions, impacts, scores = [], [], []
+        unlocks = {}
+        for kind, pos, value, achievement in self.events:
+            sounds[EVENT_SOUNDS[kind]] = True
+            if kind == KILL_EVENT:
+                explosions.append(pos)
+                scores.append(value)
+            elif kind == IMPACT_EVENT:
+                impacts.append(pos)
+            if achievement is not None:
+                unlocks[achievement] = unlocks.get(achievement, 0) + 1
+        self.events.clear()
+
+        for name in sounds:
+            if name is not None:
+                sound.play(name)
+        for pos in merge_positions(explosions, self.merge_radius):
+            particles.add_explosion(pos)
+        for pos in merge_positions(impacts, self.merge_radius):
+            particles.add_impact(pos)
+        if scores:
+            score.add_scores(scores)
+        for achievement, count in unlocks.items():
+            achievements.check_achievement(achievement, count)
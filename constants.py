@@ -1,15 +1,22 @@
 # constants.py - Greatly expanded with many more constants and enums
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60  # Render frame cap
+SIM_HZ = 60  # Fixed simulation tick rate
+MAX_SIM_TICKS_PER_FRAME = 5  # Ticks beyond this per frame are dropped
+INTERPOLATION_SNAP_DISTANCE = 64  # Sprites moving further in one tick are not interpolated
+IDLE_FPS = 15  # Frame cap for menus and other static screens
+IDLE_EVENT_TIMEOUT = 100  # ms idle screens sleep waiting for input before polling held keys
 PLAYER_SPEED = 5
 ENEMY_SPEED = 3
 BULLET_SPEED = 7
+BULLET_DAMAGE = 1
 POWERUP_SPEED = 2
 PARTICLE_LIFETIME = 30
 EXPLOSION_PARTICLES = 20
 BOSS_HEALTH = 100
 MINI_BOSS_HEALTH = 50
+BOSS_SHOOT_DELAY = 500  # ms between boss attacks at level 1; divided by the level
 PLAYER_HEALTH = 5
 SHIELD_DURATION = 5000  # ms
 SPEED_BOOST_DURATION = 10000
@@ -18,6 +25,17 @@ DIFFICULTY_EASY = 0.8
 DIFFICULTY_NORMAL = 1.0
 DIFFICULTY_HARD = 1.2
 STAR_SPEED = 2
+STAR_COUNT = 300
+STAR_MAX_SIZE = 4
+STAR_BAKE_THRESHOLD = 2000  # Larger star fields are baked into scrolling strips
+BACKGROUND_SEED = 1337
+BACKGROUND_CACHE_DIR = 'cache/backgrounds'
+ASSET_DIR = 'assets'
+ASSET_PACK_PATH = 'cache/assets.pack'  # Built by asset_pack.py; used instead of ASSET_DIR when present
+RESOURCE_LOADER_WORKERS = 4  # Threads decoding images and sounds
+ATLAS_PAGE_SIZE = 1024  # Sprite atlas page width and height
+ATLAS_PADDING = 1  # Gap between packed sprites
+ATLAS_MAX_SPRITE = 128  # Larger images are not packed into the atlas
 GRAVITY = 0.5
 MAX_LEVEL = 20  # Increased for more content
 SCORE_MULTIPLIER = 1.5
@@ -30,6 +48,9 @@ MULTIPLAYER_PORT = 5555  # Placeholder
 LOG_LEVEL_DEBUG = 0
 LOG_LEVEL_INFO = 1
 LOG_LEVEL_ERROR = 2
+LOG_FILE = 'game.log'
+LOG_STATS_INTERVAL = 10  # Seconds between frame-stat summaries
+LOG_FPS_HISTOGRAM_MAX = 240  # Faster frames share the top bin
 COLOR_BLACK = (0, 0, 0)
 COLOR_WHITE = (255, 255, 255)
 COLOR_RED = (255, 0, 0)
@@ -39,6 +60,7 @@ COLOR_YELLOW = (255, 255, 0)
 COLOR_PURPLE = (255, 0, 255)
 COLOR_CYAN = (0, 255, 255)
 COLOR_ORANGE = (255, 165, 0)
+COLOR_GRAY = (128, 128, 128)
 # Add enums if needed
 from enum import Enum
 class GameState(Enum):
@@ -54,10 +76,27 @@ class Difficulty(Enum):
     HARD = DIFFICULTY_HARD
 # Many more constants for expansion
 MAX_PARTICLES = 1000
+MAX_ENTITIES = 20000  # Capacity of the array-backed entity store
+ENTITY_CULL_MARGIN = 100  # Stored entities this far past the bottom or sides are removed
+MAX_BULLETS = 16384  # Slots in the pooled bullet manager
+BULLET_CULL_MARGIN = 32  # Pooled bullets this far off screen are recycled
+HOMING_TURN_RATE = 0.05  # Fraction of the way a homing bullet turns toward its target per tick
+PARTICLE_ALPHA_STEPS = 16  # Alpha levels pre-rendered per particle stamp
+PARTICLE_STAMP_CACHE_SIZE = 256
 MINI_MAP_SCALE = 0.2
+COLLISION_CELL_SIZE = 64  # Spatial hash cell size in pixels
+SPATIAL_HASH_MIN_PAIRS = 2500000  # Player bullets x enemies from which the grid beats the arrays
+EXPLOSION_MERGE_RADIUS = 48  # Same-frame explosions closer than this merge into one
 HUD_HEIGHT = 50
+PROFILER_HISTORY = 240  # Frames kept per profiler scope; also the overlay width in pixels
+PROFILER_OVERLAY_HEIGHT = 120
+PROFILER_OVERLAY_BUDGET_MS = 1000 / FPS
+PROFILER_LEGEND_INTERVAL = 30  # Frames between refreshes of the overlay's mean times
+DIRTY_RECT_THRESHOLD = 0.4  # Dirty-rect mode flips fully above this fraction of the screen
+BAND_GAP = 8  # Background rows with visible pixels closer than this form one dirty band
 MENU_FONT_SIZE = 50
 SMALL_FONT_SIZE = 24
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept by the shared text cache
 # Sound volumes
 SOUND_VOLUME_MAX = 1.0
 MUSIC_VOLUME_MAX = 0.8
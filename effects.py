@@ -1,6 +1,7 @@
 # effects.py - New module for screen effects
 import pygame
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from rng import rng
 
 class ScreenEffects:
     """
@@ -13,6 +14,13 @@ class ScreenEffects:
         self.fade_alpha = 0
         self.fade_speed = 0
 
+    @property
+    def active(self):
+        """
+        True while an effect is changing the whole screen.
+        """
+        return self.shake_duration > 0 or self.fade_speed > 0
+
     def apply_shake(self, duration=20, intensity=5):
         self.shake_duration = duration
         self.shake_intensity = intensity
@@ -23,8 +31,8 @@ class ScreenEffects:
 
     def apply_effects(self):
         if self.shake_duration > 0:
-            offset_x = random.randint(-self.shake_intensity, self.shake_intensity)
-            offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
+            offset_x = rng.cosmetic.randint(-self.shake_intensity, self.shake_intensity)
+            offset_y = rng.cosmetic.randint(-self.shake_intensity, self.shake_intensity)
             # Apply offset placeholder
             self.shake_duration -= 1
 
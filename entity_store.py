@@ -0,0 +1,222 @@
+# entity_store.py - New module for array-backed entities
+import numpy as np
+import pygame
+from constants import MAX_ENTITIES, ENTITY_CULL_MARGIN
+from collision_kernel import rect_array, sweep_pairs, rect_hits
+
+# Entity kinds, stored per entity in the kind column
+ENEMY, ENEMY_BULLET, PLAYER_BULLET, POWERUP = range(4)
+
+class EntityStore:
+    """
+    Data-oriented alternative to sprite groups: enemies, bullets and powerups as
+    rows of preallocated NumPy columns (struct of arrays). Live entities are
+    packed at the front of every column and the systems below work on whole
+    columns at once.
+    Images are registered once per key (a sprite type or asset name) and
+    referenced by sprite id, so the table holds one entry per look however many
+    entities are spawned. Stored entities only
+    move in straight lines; per-class update() behavior does not run, so main.py
+    stores only passive kinds (powerups and plain enemy shots) and keeps enemies
+    with AI and weapons as sprites. The ref column keeps the original object,
+    if any, for callbacks such as PowerUp.apply.
+    """
+    def __init__(self, capacity=MAX_ENTITIES):
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)  # Top-left corner
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.size = np.zeros((capacity, 2), dtype=np.int32)
+        self.health = np.zeros(capacity, dtype=np.int32)
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.score_value = np.zeros(capacity, dtype=np.int32)
+        self.sprite = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.ref = np.empty(capacity, dtype=object)
+        self._columns = (self.pos, self.vel, self.size, self.health, self.damage,
+                         self.score_value, self.sprite, self.kind, self.ref)
+        self._image_ids = {}
+        self._image_table = np.empty(16, dtype=object)  # Sprite id -> image; grows by doubling
+
+    def __len__(self):
+        return self.count
+
+    def empty(self):
+        self.ref[:self.count] = None
+        self.count = 0
+
+    def register_image(self, image, key=None):
+        """
+        Sprite id for key (by default the image itself), registering image the
+        first time key is seen.
+        """
+        key = image if key is None else key
+        sprite_id = self._image_ids.get(key)
+        if sprite_id is None:
+            sprite_id = self._image_ids[key] = len(self._image_ids)
+            if sprite_id == len(self._image_table):
+                table = np.empty(2 * sprite_id, dtype=object)
+                table[:sprite_id] = self._image_table
+                self._image_table = table
+            self._image_table[sprite_id] = image
+        return sprite_id
+
+    def spawn(self, kind, pos, vel, image, health=1, damage=0, score_value=0, refs=None, image_key=None):
+        """
+        Add one entity per row of pos (an (N, 2) array of top-left corners). The
+        other arguments are scalars or length-N sequences. Entities beyond
+        capacity are dropped. Returns the number added.
+        Pass image_key when each spawn brings its own copy of a shared picture.
+        """
+        pos = np.asarray(pos, dtype=np.float32).reshape(-1, 2)[:self.capacity - self.count]
+        n = len(pos)
+        if n == 0:
+            return 0
+        start, end = self.count, self.count + n
+        self.pos[start:end] = pos
+        self.vel[start:end] = vel
+        self.size[start:end] = image.get_size()
+        self.health[start:end] = health
+        self.damage[start:end] = damage
+        self.score_value[start:end] = score_value
+        self.sprite[start:end] = self.register_image(image, image_key)
+        self.kind[start:end] = kind
+        self.ref[start:end] = None if refs is None else list(refs)[:n]
+        self.count = end
+        return n
+
+    def add_sprites(self, sprites, kind, vel):
+        """
+        Move pygame sprites into the store, keeping their image, rect, health,
+        damage and score value. Each sprite is kept as its entity's ref. Every
+        instance builds its own copy of its image, so images are keyed by class,
+        type attribute (such as a powerup's) and size: the first sprite seen
+        with a key stands for the rest.
+        """
+        for sprite in sprites:
+            image_key = (type(sprite), getattr(sprite, 'type', None), sprite.image.get_size())
+            self.spawn(kind, [sprite.rect.topleft], vel, sprite.image, getattr(sprite, 'health', 1),
+                       getattr(sprite, 'damage', 0), getattr(sprite, 'score_value', 0), [sprite],
+                       image_key=image_key)
+            sprite.kill()
+
+    def rects(self):
+        """
+        (count, 4) int32 array of (x, y, w, h) for the live entities.
+        """
+        n = self.count
+        return np.concatenate((self.pos[:n].astype(np.int32), self.size[:n]), axis=1)
+
+    def remove(self, dead):
+        """
+        Drop the entities where the boolean mask dead (length count) is set,
+        keeping the rest in order.
+        """
+        n = self.count
+        keep = np.flatnonzero(~dead)
+        if len(keep) == n:
+            return
+        for column in self._columns:
+            column[:len(keep)] = column[keep]
+        self.ref[len(keep):n] = None
+        self.count = len(keep)
+
+def movement_system(store):
+    n = store.count
+    store.pos[:n] += store.vel[:n]
+
+def cull_system(store, bounds, margin=ENTITY_CULL_MARGIN):
+    """
+    Remove entities that have left bounds, grown by margin, past the bottom or
+    the sides. Above the top only entities moving up are removed: enemies and
+    powerups spawn there, at any height, on their way down.
+    """
+    n = store.count
+    if n == 0:
+        return
+    area = pygame.Rect(bounds).inflate(2 * margin, 2 * margin)
+    pos, size, vel = store.pos[:n], store.size[:n], store.vel[:n]
+    outside = ((pos[:, 0] >= area.right) | (pos[:, 1] >= area.bottom) |
+               (pos[:, 0] + size[:, 0] <= area.left) |
+               ((pos[:, 1] + size[:, 1] <= area.top) & (vel[:, 1] < 0)))
+    store.remove(outside)
+
+def damage_system(store, player, player_bullets=()):
+    """
+    Resolve this tick's hits on whole columns: player bullets (stored ones and
+    those in the player_bullets sprite group) against enemies, and enemies,
+    enemy bullets and powerups against the player. Bullets die on their first
+    hit; enemies at zero health die.
+    Returns (damage dealt to the player, kills as (center, score value,
+    whether the player rammed it), impact centers, collected powerup refs).
+    """
+    n = store.count
+    kind, health = store.kind[:n], store.health[:n]
+    rects = store.rects()
+    dead = np.zeros(n, dtype=bool)
+    enemies = np.flatnonzero(kind == ENEMY)
+
+    # Bullets vs enemies: every enemy a bullet overlaps takes its damage
+    stored_bullets = np.flatnonzero(kind == PLAYER_BULLET)
+    sprite_bullets = list(player_bullets)
+    bullet_rects = np.concatenate((rects[stored_bullets], rect_array(sprite_bullets).reshape(-1, 4)))
+    bullet_damage = np.concatenate((store.damage[stored_bullets],
+                                    np.array([bullet.damage for bullet in sprite_bullets], dtype=np.int32)))
+    hit_bullets, hit_enemies = sweep_pairs(bullet_rects, rects[enemies])
+    struck = np.zeros(n, dtype=bool)
+    rammed = np.zeros(n, dtype=bool)
+    if len(hit_bullets):
+        np.subtract.at(health, enemies[hit_enemies], bullet_damage[hit_bullets])
+        struck[enemies[hit_enemies]] = True
+        spent = np.unique(hit_bullets)
+        dead[stored_bullets[spent[spent < len(stored_bullets)]]] = True
+        for i in spent[spent >= len(stored_bullets)].tolist():
+            sprite_bullets[i - len(stored_bullets)].kill()
+
+    # Everything the player touches
+    touching = rect_hits(player.rect, rects)
+    player_damage = 0
+    collected = []
+    for i in touching.tolist():
+        if kind[i] == ENEMY:
+            if not player.invincible:
+                player_damage += int(store.damage[i])
+            health[i] -= player.collision_damage
+            struck[i] = True
+            rammed[i] = True
+        elif kind[i] == ENEMY_BULLET:
+            if not player.is_shielded():
+                player_damage += int(store.damage[i])
+            dead[i] = True
+        elif kind[i] == POWERUP:
+            collected.append(store.ref[i])
+            dead[i] = True
+
+    killed = struck & (health <= 0)
+    centers = store.pos[:n] + store.size[:n] / 2
+    kills = list(zip(map(tuple, centers[killed].astype(np.int32).tolist()), store.score_value[:n][killed].tolist(),
+                     rammed[killed].tolist()))
+    impacts = list(map(tuple, centers[struck & ~killed].astype(np.int32).tolist()))
+    store.remove(dead | killed)
+    return player_damage, kills, impacts, collected
+
+def render_system(store, screen):
+    """
+    Blit every on-screen entity in one Surface.blits batch. Returns the
+    bounding rect of everything drawn, or [] if nothing was.
+    """
+    n = store.count
+    if n == 0:
+        return []
+    width, height = screen.get_size()
+    topleft = store.pos[:n].astype(np.int32)
+    bottomright = topleft + store.size[:n]
+    visible = np.flatnonzero((topleft[:, 0] < width) & (topleft[:, 1] < height) &
+                             (bottomright[:, 0] > 0) & (bottomright[:, 1] > 0))
+    if len(visible) == 0:
+        return []
+    images = store._image_table[store.sprite[visible]]
+    screen.blits(zip(images, topleft[visible].tolist()), doreturn=False)
+    left, top = topleft[visible].min(axis=0).tolist()
+    right, bottom = bottomright[visible].max(axis=0).tolist()
+    return pygame.Rect(left, top, right - left, bottom - top).clip(screen.get_rect())
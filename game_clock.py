@@ -0,0 +1,50 @@
+# game_clock.py - New module for simulation time
+from constants import SIM_HZ
+
+class GameClock:
+    """
+    Virtual clock for gameplay timing. It advances by one fixed tick each time
+    tick() is called, once per simulation tick, so shoot delays, animations and
+    combo windows follow the simulation rather than the wall clock and replay
+    identically at any speed. scale speeds the game up or slows it down by
+    changing how much real time the main loop feeds the simulation; a paused
+    clock feeds none.
+    """
+    def __init__(self, hz=SIM_HZ):
+        self.tick_ms = 1000.0 / hz
+        self.time = 0.0
+        self.scale = 1.0
+        self.paused = False
+
+    def reset(self):
+        """
+        Back to time zero and running, for a new game. The scale is kept.
+        """
+        self.time = 0.0
+        self.paused = False
+
+    def tick(self):
+        self.time += self.tick_ms
+
+    def get_ticks(self):
+        """
+        Milliseconds of simulated time, like pygame.time.get_ticks.
+        """
+        return int(self.time)
+
+    def scaled(self, frame_seconds):
+        """
+        Real frame time converted to simulation time to feed the fixed timestep.
+        """
+        return 0.0 if self.paused else frame_seconds * self.scale
+
+    def set_scale(self, scale):
+        self.scale = max(0.0, scale)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+game_clock = GameClock()
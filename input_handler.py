@@ -1,13 +1,18 @@
 # input_handler.py - New module for input
+import pygame
 from pygame.locals import *
 
 class InputHandler:
     """
-    Centralized input handling.
+    Centralized input handling. With a replay, every simulation tick reads its
+    keys from the recording instead of the keyboard; with a recorder, the keys
+    of every tick are written out.
     """
-    def __init__(self):
+    def __init__(self, recorder=None, replay=None):
         self.keys = pygame.key.get_pressed()
         self.events = []
+        self.recorder = recorder
+        self.replay = replay
 
     def handle_events(self):
         self.events = pygame.event.get()
@@ -17,6 +22,34 @@ class InputHandler:
                 # Handle quit
                 pass
 
+    def wait_events(self, timeout):
+        """
+        Like handle_events, but sleeps until an event arrives or timeout ms pass.
+        Used by idle screens so they do not spin the CPU.
+        """
+        event = pygame.event.wait(timeout)
+        self.events = [event] if event.type != NOEVENT else []
+        self.events.extend(pygame.event.get())
+        self.keys = pygame.key.get_pressed()
+        for event in self.events:
+            if event.type == QUIT:
+                # Handle quit
+                pass
+
+    def tick(self):
+        """
+        Call once per simulation tick, before anything reads the keys.
+        """
+        if self.replay is not None:
+            self.keys = self.replay.next_keys()
+        if self.recorder is not None:
+            self.recorder.record(self.keys)
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
     def get_keys(self):
         return self.keys
 
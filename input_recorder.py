@@ -0,0 +1,145 @@
+# input_recorder.py - New module for recording and replaying input
+"""
+Per-tick input streams: recordings, their replay, and a scripted bot that
+feeds input the same way. A recording is MAGIC, a header (format version, master
+RNG seed, number of keys), the pygame key codes in bit order, then runs of
+(key bitmask, ticks held), each as little-endian uint32 + uint16. Holding a key
+for a second costs six bytes.
+"""
+import struct
+import random
+from pygame.locals import *
+
+RECORDED_KEYS = (
+    K_UP, K_DOWN, K_LEFT, K_RIGHT, K_w, K_a, K_s, K_d,
+    K_SPACE, K_LSHIFT, K_LCTRL, K_RETURN, K_ESCAPE, K_p, K_r, K_b
+)
+MAGIC = b'SSIR'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<HQB')
+KEY = struct.Struct('<I')
+RUN = struct.Struct('<IH')
+MAX_RUN = 0xFFFF
+
+def key_mask(keys, tracked=RECORDED_KEYS):
+    mask = 0
+    for bit, key in enumerate(tracked):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+class MaskKeys:
+    """
+    Read-only stand-in for pygame.key.get_pressed() rebuilt from a key bitmask.
+    """
+    def __init__(self, mask, tracked=RECORDED_KEYS):
+        self.pressed = frozenset(key for bit, key in enumerate(tracked) if mask >> bit & 1)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+class InputRecorder:
+    """
+    Writes the keys held on each simulation tick, run-length encoded.
+    """
+    def __init__(self, path, seed, tracked=RECORDED_KEYS):
+        self.tracked = tracked
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC + HEADER.pack(FORMAT_VERSION, seed, len(tracked)))
+        self.file.write(b''.join(KEY.pack(key) for key in tracked))
+        self.mask = 0
+        self.run = 0
+        self.ticks = 0
+
+    def record(self, keys):
+        mask = key_mask(keys, self.tracked)
+        if mask == self.mask and self.run < MAX_RUN:
+            self.run += 1
+        else:
+            self._flush()
+            self.mask = mask
+            self.run = 1
+        self.ticks += 1
+
+    def _flush(self):
+        if self.run:
+            self.file.write(RUN.pack(self.mask, self.run))
+
+    def close(self):
+        self._flush()
+        self.run = 0
+        self.file.close()
+
+class InputReplay:
+    """
+    Plays a recording back one tick at a time. Raises ValueError for files
+    that are not recordings of the current format.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        start = len(MAGIC) + HEADER.size
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an input recording")
+        version, self.seed, count = HEADER.unpack(data[len(MAGIC):start])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}")
+        self.tracked = [key for (key,) in KEY.iter_unpack(data[start:start + count * KEY.size])]
+        self.runs = list(RUN.iter_unpack(data[start + count * KEY.size:]))
+        self.total_ticks = sum(run for mask, run in self.runs)
+        self.keys = {}  # Mask -> MaskKeys, so each distinct key state is built once
+        self.index = 0
+        self.left = self.runs[0][1] if self.runs else 0
+        self.ticks = 0
+
+    @property
+    def finished(self):
+        return self.ticks >= self.total_ticks
+
+    def next_keys(self):
+        """
+        Keys held on the next tick; nothing is held once the recording ends.
+        """
+        if self.finished:
+            return MaskKeys(0)
+        while self.left == 0:
+            self.index += 1
+            self.left = self.runs[self.index][1]
+        mask = self.runs[self.index][0]
+        self.left -= 1
+        self.ticks += 1
+        keys = self.keys.get(mask)
+        if keys is None:
+            keys = self.keys[mask] = MaskKeys(mask, self.tracked)
+        return keys
+
+class ScriptedBot:
+    """
+    Input source that plays instead of a person, with the same interface as
+    InputReplay: keeps fire held and picks a new movement (left, right, still,
+    with an occasional up or down) every 15-90 ticks. The same seed gives the
+    same inputs. With max_ticks it finishes after that many ticks.
+    """
+    MOVES = ((), (K_LEFT,), (K_RIGHT,), (K_LEFT,), (K_RIGHT,), (K_LEFT, K_UP), (K_RIGHT, K_DOWN))
+
+    def __init__(self, seed, max_ticks=None):
+        self.seed = seed
+        self.max_ticks = max_ticks
+        self.ticks = 0
+        self.random = random.Random(seed)
+        self.moves = [MaskKeys(sum(1 << RECORDED_KEYS.index(key) for key in move + (K_SPACE,)))
+                      for move in self.MOVES]
+        self.keys = self.moves[0]
+        self.hold = 0
+
+    @property
+    def finished(self):
+        return self.max_ticks is not None and self.ticks >= self.max_ticks
+
+    def next_keys(self):
+        if self.hold == 0:
+            self.keys = self.random.choice(self.moves)
+            self.hold = self.random.randint(15, 90)
+        self.hold -= 1
+        self.ticks += 1
+        return self.keys
@@ -1,20 +1,79 @@
 # logging_system.py - New module for logging game events
+import time
+import queue
 import logging
-from constants import LOG_LEVEL_INFO
+import logging.handlers
+import numpy as np
+from constants import (
+    LOG_LEVEL_DEBUG, LOG_LEVEL_INFO, LOG_LEVEL_ERROR, LOG_FILE, LOG_STATS_INTERVAL, LOG_FPS_HISTOGRAM_MAX
+)
+
+# The game's level constants -> logging levels
+LOG_LEVELS = {LOG_LEVEL_DEBUG: logging.DEBUG, LOG_LEVEL_INFO: logging.INFO, LOG_LEVEL_ERROR: logging.ERROR}
+# QueueHandler of the newest LoggingSystem; the 'game' logger has only this one
+_queue_handler = None
 
 class LoggingSystem:
     """
-    Handles game logging.
+    Handles game logging. Records go through a queue to a listener thread that
+    owns the log file, so logging from the game loop never waits on disk.
+    Frame stats are counted into an FPS histogram (1 FPS bins) and written as
+    one percentile summary every `stats_interval` seconds, at debug level only.
+    A new instance takes the shared 'game' logger over from the previous one,
+    so records are never written twice.
     """
-    def __init__(self, level=LOG_LEVEL_INFO):
-        logging.basicConfig(level=level, filename='game.log', filemode='w')
+    def __init__(self, level=LOG_LEVEL_INFO, filename=LOG_FILE, stats_interval=LOG_STATS_INTERVAL):
+        file_handler = logging.FileHandler(filename, mode='w')
+        file_handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
+        self.queue = queue.SimpleQueue()
+        self.listener = logging.handlers.QueueListener(self.queue, file_handler)
         self.logger = logging.getLogger('game')
+        self.logger.setLevel(LOG_LEVELS.get(level, level))
+        global _queue_handler
+        if _queue_handler is not None:
+            self.logger.removeHandler(_queue_handler)
+        _queue_handler = self.handler = logging.handlers.QueueHandler(self.queue)
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+        self.listener.start()
+        self.stats_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self.stats_interval = stats_interval
+        self.histogram = [0] * (LOG_FPS_HISTOGRAM_MAX + 1)
+        self.stats_start = time.monotonic()
 
     def log_event(self, message):
         self.logger.info(message)
 
     def log_frame_stats(self, fps):
-        self.logger.debug(f"FPS: {fps}")
+        if not self.stats_enabled:
+            return
+        self.histogram[min(int(fps), LOG_FPS_HISTOGRAM_MAX)] += 1
+        if time.monotonic() - self.stats_start >= self.stats_interval:
+            self.flush_frame_stats()
+
+    def flush_frame_stats(self):
+        """
+        Log FPS percentiles for the frames counted since the last flush and start over.
+        Low percentiles are the slow frames.
+        """
+        counts = np.array(self.histogram)
+        total = counts.sum()
+        elapsed = time.monotonic() - self.stats_start
+        if total:
+            cumulative = np.cumsum(counts)
+            p1, p5, p50, p95 = np.searchsorted(cumulative, total * np.array((0.01, 0.05, 0.5, 0.95))).tolist()
+            nonzero = np.flatnonzero(counts)
+            self.logger.debug(f"FPS over {elapsed:.1f}s ({total} frames): min {nonzero[0]} p1 {p1} p5 {p5} "
+                              f"p50 {p50} p95 {p95} max {nonzero[-1]}")
+        self.histogram = [0] * len(self.histogram)
+        self.stats_start = time.monotonic()
 
     def close(self):
+        if self.stats_enabled:
+            self.flush_frame_stats()
+        global _queue_handler
+        self.logger.removeHandler(self.handler)
+        if _queue_handler is self.handler:
+            _queue_handler = None
+        self.listener.stop()  # Drains the queue before returning
         logging.shutdown()
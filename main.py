@@ -3,12 +3,17 @@
 This module serves as the main entry point for the Epic Space Shooter game.
 It initializes Pygame, manages game states, and handles core game loop logic.
 Integrates with Streamlit via config.json and --load flag for saved games.
+Run with --headless and --ticks or --seconds to soak-test the game loop with no
+window, no audio and no frame cap.
 """
 import pygame
 from pygame.locals import *
 import json
 import sys
 import os
+import time
+import argparse
+startup_time = time.perf_counter()  # For measuring time to the first menu frame
 from player import Player, PlayerControls, PlayerStats
 from enemy import (
     Enemy, KamikazeEnemy, ShooterEnemy, ZigZagEnemy, BomberEnemy, StealthEnemy,
@@ -26,9 +31,10 @@ from constants import (
     POWERUP_SPEED, PARTICLE_LIFETIME, EXPLOSION_PARTICLES, BOSS_HEALTH,
     MINI_BOSS_HEALTH, PLAYER_HEALTH, SHIELD_DURATION, SPEED_BOOST_DURATION,
     WEAPON_UPGRADE_DURATION, DIFFICULTY_EASY, DIFFICULTY_NORMAL, DIFFICULTY_HARD,
-    STAR_SPEED, GRAVITY, MAX_LEVEL, SCORE_MULTIPLIER
+    STAR_SPEED, GRAVITY, MAX_LEVEL, SCORE_MULTIPLIER, IDLE_FPS, IDLE_EVENT_TIMEOUT,
+    SPATIAL_HASH_MIN_PAIRS
 )
-from menu import Menu, PauseMenu, SettingsMenu, HighScoreMenu
+from menu import Menu, PauseMenu, SettingsMenu, HighScoreMenu, LoadingScreen
 from highscore import HighScore
 from sound_manager import SoundManager, MusicManager
 from powerup import (
@@ -36,7 +42,9 @@ from powerup import (
     ScorePowerUp, InvincibilityPowerUp, MagnetPowerUp, BombPowerUp
 )
 from boss import Boss, MiniBoss, PhaseBoss, FinalBoss
-from background import Background, StarField, NebulaBackground, PlanetBackground
+from background import (
+    Background, StarField, NebulaBackground, PlanetBackground, BackgroundCompositor
+)
 from particle import (
     ParticleSystem, SmokeParticle, FireParticle, SparkParticle,
     DebrisParticle, GlowParticle
@@ -53,14 +61,61 @@ from effects import ScreenEffects, ShakeEffect, FadeEffect
 from input_handler import InputHandler
 from collision_manager import CollisionManager
 from resource_loader import ResourceLoader
+from renderer import DirtyRectRenderer
+from timestep import FixedTimestep, Interpolator
+from game_clock import game_clock
+from rng import rng
+from input_recorder import InputRecorder, InputReplay, ScriptedBot
+from profiler import FrameProfiler
+from bullet_manager import BulletManager
+from entity_store import EntityStore, ENEMY_BULLET, POWERUP, movement_system, cull_system, render_system
 from level_designs import Level1Design, Level2Design, Level3Design, Level4Design, Level5Design, Level6Design, Level7Design
 
+# Command line
+parser = argparse.ArgumentParser(description="Epic Space Shooter")
+parser.add_argument("--load", action="store_true", help="Start from the saved game")
+parser.add_argument("--dirty-rects", action="store_true", help="Present frames with dirty-rect updates")
+parser.add_argument("--headless", action="store_true",
+                    help="Simulate as fast as possible with no window or audio; restarts on game over")
+parser.add_argument("--ticks", type=int, help="Headless: stop after this many simulation ticks")
+parser.add_argument("--seconds", type=float, help="Headless: stop after this much wall time")
+parser.add_argument("--time-scale", type=float, default=1.0,
+                    help="Game speed; below 1 is slow motion, above 1 fast-forward")
+parser.add_argument("--seed", type=int, help="Master RNG seed; every game replays identically with the same seed")
+parser.add_argument("--record", metavar="FILE", help="Record the input of the first game played")
+parser.add_argument("--replay", metavar="FILE",
+                    help="Play back a recording (with its seed) and exit when it ends; add --headless for full speed")
+parser.add_argument("--bot", action="store_true",
+                    help="Let a scripted bot play one game (seeded by --seed) instead of the keyboard")
+parser.add_argument("--startup-only", action="store_true",
+                    help="Exit once the first menu frame is shown (startup benchmarks)")
+parser.add_argument("--profile", action="store_true", help="Time every update and draw phase (F3 shows the overlay)")
+parser.add_argument("--profile-out", metavar="FILE", help="Write the profiler's last frames to a .csv or .json file on exit")
+parser.add_argument("--bullets", choices=("sprites", "pool"), default="sprites",
+                    help="Keep enemy bullets in a sprite group or the pooled bullet manager")
+parser.add_argument("--entities", choices=("sprites", "store"), default="sprites",
+                    help="Keep powerups and straight enemy shots in sprite groups or the array-backed entity store")
+args = parser.parse_args()
+if args.bot and args.replay:
+    parser.error("--bot and --replay both supply the input; pick one")
+if args.headless:
+    if args.ticks is None and args.seconds is None and not args.replay:
+        parser.error("--headless needs --ticks or --seconds")  # A replay stops when its recording ends
+    # SDL reads these at init; the dummy drivers open no window and play nothing
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
 # Initialize Pygame
 pygame.init()
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Epic Space Shooter - Ultimate Shmup Edition")
 clock = pygame.time.Clock()
 
+# Start decoding the menu's assets right away so they load while the rest of
+# the game objects are built
+resource_loader = ResourceLoader()
+resource_loader.request_group("menu")
+
 # Initialize all game objects and managers
 """
 Initialize core game components, including player, enemies, UI, and managers.
@@ -71,8 +126,12 @@ player_controls = PlayerControls(player)
 player_stats = PlayerStats(player)
 enemies = pygame.sprite.Group()
 player_bullets = pygame.sprite.Group()
-enemy_bullets = pygame.sprite.Group()
+enemy_bullets = BulletManager() if args.bullets == "pool" else pygame.sprite.Group()
 powerups = pygame.sprite.Group()
+sprite_groups = [enemies, player_bullets, powerups]  # Drawn and interpolated as sprites
+if args.bullets == "sprites":
+    sprite_groups.insert(2, enemy_bullets)
+entity_store = EntityStore() if args.entities == "store" else None  # Holds powerups and plain enemy shots
 particles = ParticleSystem()
 ui = UI()
 hud = HUD()
@@ -92,6 +151,9 @@ background = Background()
 star_field = StarField()
 nebula_background = NebulaBackground()
 planet_background = PlanetBackground()
+background_compositor = BackgroundCompositor(
+    [background, star_field, nebula_background, planet_background]
+)
 animation_manager = AnimationManager()
 enemy_ai = EnemyAI()
 swarm_ai = SwarmAI()
@@ -103,19 +165,38 @@ achievements = AchievementSystem()
 logging_system = LoggingSystem()
 multiplayer_manager = MultiplayerManager()  # Placeholder for future multiplayer
 screen_effects = ScreenEffects(screen)
-input_handler = InputHandler()
+if args.replay:
+    input_source = InputReplay(args.replay)
+elif args.bot:
+    input_source = ScriptedBot(args.seed if args.seed is not None else rng.seed)
+else:
+    input_source = None
+input_handler = InputHandler(replay=input_source)  # Replays and the bot feed every tick's keys
 collision_manager = CollisionManager()
-resource_loader = ResourceLoader()
+renderer = DirtyRectRenderer(dirty_rects=args.dirty_rects)  # Compare with full flips
+timestep = FixedTimestep()
+game_clock.set_scale(args.time_scale)
+interpolator = Interpolator()
+profiler = FrameProfiler(enabled=args.profile or bool(args.profile_out))
 
 # Load resources
 """
-Load all game assets (images, sounds, fonts) using the resource loader.
-This ensures all assets are available before the game starts.
+Show a loading screen until the menu's assets are decoded. Gameplay assets keep
+loading on the resource loader's threads while the menu is up; level and boss
+groups are requested when they are first needed.
 """
-resource_loader.load_all_images()
-resource_loader.load_all_sounds()
+resource_loader.request_group("gameplay")
 resource_loader.load_font("default", 36)
 resource_loader.load_font("small", 24)
+loading_screen = LoadingScreen(screen)
+while not resource_loader.is_ready("menu"):
+    input_handler.handle_events()
+    loading_screen.draw(*resource_loader.progress("menu"))
+    renderer.flip()
+    clock.tick(IDLE_FPS)
+resource_loader.convert_all()  # The display exists, so images can take its pixel format
+if resource_loader.errors:
+    logging_system.log_event(f"Failed to load assets: {', '.join(sorted(resource_loader.errors))}")
 
 # Load configuration from Streamlit
 """
@@ -142,55 +223,122 @@ Initialize core game variables, including state, difficulty, and counters.
 Check for --load flag to start in playing state with saved data.
 """
 game_state = "menu"
-load_game = "--load" in sys.argv
+load_game = args.load
 if load_game:
     game_state = "playing"
 running = True
 paused = False
 difficulty = config.get_difficulty()
 current_level = 1
+background_level = 1  # Level the procedural background layers were generated for
 wave_count = 0
 boss_active = False
 multiplayer_mode = False  # Placeholder for future multiplayer
+shown_screen = None  # (game_state, paused) drawn last; idle screens redraw only when it changes
+first_menu_frame = True
+headless_games = 0
+
+def set_paused(value):
+    """
+    Enter or leave the pause menu; the game clock stands still while paused.
+    """
+    global paused
+    paused = value
+    if paused:
+        game_clock.pause()
+    else:
+        game_clock.resume()
+
+def start_new_game():
+    """
+    Reset every game object for a fresh run and switch to the playing state.
+    """
+    global game_state, wave_count, boss_active
+    game_state = "playing"
+    set_paused(False)
+    game_clock.reset()
+    if input_handler.replay is not None:
+        rng.reseed(input_handler.replay.seed)
+    else:
+        rng.reseed(args.seed)
+    if args.record:
+        input_handler.recorder = InputRecorder(args.record, rng.seed)
+        args.record = None  # Only the first game is recorded
+    player.reset()
+    enemies.empty()
+    player_bullets.empty()
+    enemy_bullets.empty()
+    powerups.empty()
+    if entity_store is not None:
+        entity_store.empty()
+    level_manager.reset()
+    score_system.reset()
+    achievements.reset()
+    collision_manager.damage_taken = 0
+    wave_count = 0
+    boss_active = False
+    resource_loader.pack_group("gameplay")
+    music_manager.play_background_music("level1")
+    logging_system.log_event(f"New game started with seed {rng.seed}")
+
+if args.headless or input_source is not None:
+    start_new_game()
+    headless_start = time.perf_counter()
 
 # Main game loop
 """
 The main game loop handles all game states: menu, settings, highscores, playing, and game over.
 Processes input, updates game objects, and renders the scene at 60 FPS.
+Idle screens (menus, paused, game over) sleep on input and run at IDLE_FPS.
 """
 while running:
-    input_handler.handle_events()  # Centralized input handling
+    if input_handler.replay is not None:
+        # A replay ends with its recording, or when its game does; a bot plays one game
+        if input_handler.replay.finished or game_state == "game_over":
+            break
+    if args.headless:
+        if ((args.ticks is not None and timestep.ticks >= args.ticks) or
+                (args.seconds is not None and time.perf_counter() - headless_start >= args.seconds)):
+            break
+
+    # Centralized input handling; gameplay polls every frame, idle screens block
+    # until input arrives or the timeout passes. A screen's first frame never
+    # waits, so it appears as soon as it is entered.
+    screen_changed = (game_state, paused) != shown_screen
+    if (game_state == "playing" and not paused) or args.headless or screen_changed:
+        input_handler.handle_events()
+    else:
+        input_handler.wait_events(IDLE_EVENT_TIMEOUT)
+    for event in input_handler.events:
+        if event.type == KEYDOWN and event.key == K_F3:
+            profiler.toggle_overlay()
+        elif event.type == KEYDOWN and event.key == K_p and game_state == "playing" and not paused:
+            set_paused(True)
+            logging_system.log_event("Game paused")
+    if screen_changed:
+        shown_screen = (game_state, paused)
+        for idle_menu in (menu, settings_menu, highscore_menu, pause_menu):
+            idle_menu.invalidate()
 
     if game_state == "menu":
         """
         Menu state: Display main menu and handle user selections.
         Supports starting a new game, loading a saved game, settings, high scores, or quitting.
         """
-        menu.draw(screen)
         action = menu.handle_selection(input_handler.get_keys())
         if action == "start":
-            game_state = "playing"
-            player.reset()
-            enemies.empty()
-            player_bullets.empty()
-            enemy_bullets.empty()
-            powerups.empty()
-            level_manager.reset()
-            score_system.reset()
-            achievements.reset()
-            wave_count = 0
-            boss_active = False
-            music_manager.play_background_music("level1")
-            logging_system.log_event("New game started")
+            start_new_game()
         elif action == "load" or load_game:
             save_data = save_game.load()
             if save_data:
                 player.load_from_save(save_data['player'])
                 level_manager.level = save_data['level']
                 score_system.score = save_data['score']
+                rng.reseed(save_data.get('seed'))  # Older saves have no seed
                 current_level = level_manager.level
                 game_state = "playing"
                 load_game = False  # Reset flag after loading
+                resource_loader.pack_group("gameplay")
                 music_manager.play_background_music(f"level{current_level}")
                 logging_system.log_event("Loaded saved game")
             else:
@@ -202,14 +350,21 @@ while running:
         elif action == "quit":
             running = False
             logging_system.log_event("Game quit from menu")
-        pygame.display.flip()
+        if menu.draw(screen):
+            renderer.flip()
+            if first_menu_frame:
+                first_menu_frame = False
+                logging_system.log_event(
+                    f"Time to first menu frame: {(time.perf_counter() - startup_time) * 1000:.0f} ms")
+                if args.startup_only:
+                    running = False
+        clock.tick(IDLE_FPS)
 
     elif game_state == "settings":
         """
         Settings state: Allow configuration of difficulty, audio, and controls.
         Updates config object and saves changes.
         """
-        settings_menu.draw(screen)
         settings_action = settings_menu.handle_selection(input_handler.get_keys())
         if settings_action == "back":
             game_state = "menu"
@@ -223,17 +378,20 @@ while running:
         elif settings_action == "music_volume":
             config.music_volume = settings_menu.get_selected_volume()
             music_manager.set_volume(config.music_volume)
-        pygame.display.flip()
+        if settings_menu.draw(screen):
+            renderer.flip()
+        clock.tick(IDLE_FPS)
 
     elif game_state == "highscores":
         """
         Highscores state: Display top scores and allow returning to menu.
         """
-        highscore_menu.draw(screen, highscore.get_top_scores())
+        if highscore_menu.draw(screen, highscore.get_top_scores()):
+            renderer.flip()
         if input_handler.is_key_pressed(K_ESCAPE):
             game_state = "menu"
             logging_system.log_event("Returned to menu from highscores")
-        pygame.display.flip()
+        clock.tick(IDLE_FPS)
 
     elif game_state == "playing":
         """
@@ -241,16 +399,16 @@ while running:
         Handles pausing, entity updates, and level progression.
         """
         if paused:
-            pause_menu.draw(screen)
             pause_action = pause_menu.handle_selection(input_handler.get_keys())
             if pause_action == "resume":
-                paused = False
+                set_paused(False)
                 logging_system.log_event("Game resumed")
             elif pause_action == "save":
                 save_data = {
                     'player': player.save_data(),
                     'level': level_manager.level,
-                    'score': score_system.score
+                    'score': score_system.score,
+                    'seed': rng.seed
                 }
                 save_game.save(save_data)
                 logging_system.log_event("Game saved")
@@ -260,104 +418,175 @@ while running:
                 game_state = "menu"
                 music_manager.stop_music()
                 logging_system.log_event("Quit to menu from pause")
-            pygame.display.flip()
+            if pause_menu.draw(screen):
+                renderer.flip()
+            clock.tick(IDLE_FPS)
             continue
 
-        # Update player
-        player_controls.update(input_handler.get_keys(), difficulty)
-        player_stats.update()
+        # Simulation runs in fixed SIM_HZ ticks, as many as the elapsed time calls
+        # for (capped), so a slow frame no longer slows the game down. The first
+        # frame after entering the state runs exactly one tick, as does every
+        # headless frame.
+        frame_time = timestep.dt if screen_changed or args.headless else clock.get_time() / 1000
+        for tick in range(timestep.advance(game_clock.scaled(frame_time))):
+            game_clock.tick()
+            input_handler.tick()
+            if not args.headless:
+                interpolator.capture((player,), *sprite_groups)
 
-        # Level and wave management
-        level_manager.update()
-        wave_manager.update()
-        current_level = level_manager.level
+            # Update player
+            with profiler.scope("player"):
+                player_controls.update(input_handler.get_keys(), difficulty)
+                player_stats.update()
 
-        # Spawn entities
-        if wave_manager.should_spawn_wave():
-            wave_count += 1
-            # Use level-specific designs
-            level_design = {
-                1: Level1Design,
-                2: Level2Design,
-                3: Level3Design,
-                4: Level4Design,
-                5: Level5Design,
-                6: Level6Design,
-                7: Level7Design
-                # Add more levels up to MAX_LEVEL
-            }.get(current_level, Level1Design)(current_level)
-            for enemy in level_design.get_wave(wave_count % MAX_WAVES_PER_LEVEL):
-                enemy_ai.apply_ai(enemy, current_level)
-                enemies.add(enemy)
-            logging_system.log_event(f"Spawned wave {wave_count} in level {current_level}")
+            # Level and wave management
+            with profiler.scope("spawning"):
+                level_manager.update()
+                wave_manager.update()
+                current_level = level_manager.level
+                if current_level != background_level and not args.headless:
+                    # Each level has its own nebula and planets
+                    background_level = current_level
+                    nebula_background.set_level(current_level)
+                    planet_background.set_level(current_level)
+                    background_compositor.refresh()
+                level_assets = f"level{current_level}"
+                if resource_loader.is_ready(level_assets):
+                    resource_loader.pack_group(level_assets)
 
-        if level_manager.should_spawn_powerup():
-            powerup = level_design.get_powerup()
-            powerups.add(powerup)
-            logging_system.log_event("Spawned powerup")
+                # Spawn entities
+                if wave_manager.should_spawn_wave():
+                    wave_count += 1
+                    # Use level-specific designs
+                    level_design = {
+                        1: Level1Design,
+                        2: Level2Design,
+                        3: Level3Design,
+                        4: Level4Design,
+                        5: Level5Design,
+                        6: Level6Design,
+                        7: Level7Design
+                        # Add more levels up to MAX_LEVEL
+                    }.get(current_level, Level1Design)(current_level)
+                    wave = level_design.get_wave(wave_count % MAX_WAVES_PER_LEVEL)
+                    for enemy in wave:
+                        enemy_ai.apply_ai(enemy, current_level)
+                        enemies.add(enemy)
+                    logging_system.log_event(f"Spawned wave {wave_count} in level {current_level}")
 
-        if wave_manager.is_mini_boss_wave(wave_count):
-            mini_boss = MiniBoss(current_level)
-            boss_ai.apply_ai(mini_boss)
-            enemies.add(mini_boss)
-            logging_system.log_event("Spawned mini-boss")
+                if level_manager.should_spawn_powerup():
+                    powerup = level_design.get_powerup()
+                    if entity_store is not None:
+                        entity_store.add_sprites([powerup], POWERUP, (0, POWERUP_SPEED))
+                    else:
+                        powerups.add(powerup)
+                    logging_system.log_event("Spawned powerup")
 
-        if level_manager.is_boss_time() and not boss_active:
-            if current_level == MAX_LEVEL:
-                boss = FinalBoss()
-            else:
-                boss = PhaseBoss(current_level)
-            boss_ai.apply_ai(boss)
-            enemies.add(boss)
-            boss_active = True
-            music_manager.play_background_music("boss")
-            logging_system.log_event(f"Spawned boss for level {current_level}")
+                if wave_manager.is_mini_boss_wave(wave_count):
+                    mini_boss = MiniBoss(current_level)
+                    boss_ai.apply_ai(mini_boss)
+                    enemies.add(mini_boss)
+                    logging_system.log_event("Spawned mini-boss")
+
+                if level_manager.is_boss_time() and not boss_active:
+                    resource_loader.request_group("boss")
+                    if current_level == MAX_LEVEL:
+                        boss = FinalBoss()
+                    else:
+                        boss = PhaseBoss(current_level)
+                    boss_ai.apply_ai(boss)
+                    enemies.add(boss)
+                    boss_active = True
+                    music_manager.play_background_music("boss")
+                    logging_system.log_event(f"Spawned boss for level {current_level}")
 
-        # Update entities
-        enemies.update(enemy_bullets, player, difficulty, screen_effects)
-        player_bullets.update()
-        enemy_bullets.update()
-        powerups.update()
-        particles.update()
-        star_field.update()
-        nebula_background.update()
-        planet_background.update()
-        animation_manager.update()
-        score_system.update()
+            # Update entities
+            with profiler.scope("enemies.update"):
+                enemies.update(enemy_bullets, player, difficulty, screen_effects)
+            with profiler.scope("bullets.update"):
+                player_bullets.update()
+                enemy_bullets.update()
+                powerups.update()
+            if entity_store is not None:
+                with profiler.scope("entities.update"):
+                    movement_system(entity_store)
+                    if args.bullets == "sprites":
+                        # Plain enemy shots fly straight down, so the store can move them from
+                        # next tick on; homing, spread and laser shots keep their sprite behavior
+                        entity_store.add_sprites([bullet for bullet in enemy_bullets if type(bullet) is EnemyBullet],
+                                                 ENEMY_BULLET, (0, BULLET_SPEED))
+                    cull_system(entity_store, screen.get_rect())
+            with profiler.scope("particles.update"):
+                particles.update()
+            with profiler.scope("background.update"):
+                star_field.update()
+                nebula_background.update()
+                planet_background.update()
+            with profiler.scope("systems.update"):
+                animation_manager.update()
+                score_system.update()
 
-        # Collision handling
-        collision_manager.handle_player_enemies(player, enemies, particles, sound_manager, score_system, achievements)
-        collision_manager.handle_bullets_enemies(player_bullets, enemies, particles, sound_manager, score_system, achievements)
-        collision_manager.handle_powerups(player, powerups, sound_manager, achievements)
-        collision_manager.handle_enemy_bullets(player, enemy_bullets, sound_manager)
+            # Collision handling
+            with profiler.scope("collisions"):
+                # The grid only wins once bullets vs enemies dominates the tick
+                crowded = len(player_bullets) * len(enemies) >= SPATIAL_HASH_MIN_PAIRS
+                collision_manager.strategy = 'spatial_hash' if crowded else 'vectorized'
+                collision_manager.handle_player_enemies(player, enemies)
+                collision_manager.handle_bullets_enemies(player_bullets, enemies)
+                collision_manager.handle_powerups(player, powerups)
+                collision_manager.handle_enemy_bullets(player, enemy_bullets)
+                if entity_store is not None:
+                    collision_manager.handle_entities(player, entity_store, player_bullets)
+            with profiler.scope("collisions.dispatch"):
+                collision_manager.dispatch(particles, sound_manager, score_system, achievements)
 
-        # Check for game over
-        if player.health <= 0:
-            game_state = "game_over"
-            music_manager.play_sound("game_over")
-            screen_effects.apply_fade_out()
-            highscore.update(score_system.score)
-            logging_system.log_event(f"Game over - Score: {score_system.score}")
+            # Check for game over
+            if player.health <= 0:
+                game_state = "game_over"
+                input_handler.stop_recording()
+                music_manager.play_sound("game_over")
+                screen_effects.apply_fade_out()
+                highscore.update(score_system.score)
+                logging_system.log_event(f"Game over - Score: {score_system.score}")
+            if game_state != "playing":
+                break
+
+        if args.headless:
+            profiler.end_frame()
+            continue  # Nothing to show and no frame cap
 
         # Drawing
-        background.draw(screen)
-        star_field.draw(screen)
-        nebula_background.draw(screen)
-        planet_background.draw(screen)
-        screen.blit(player.image, player.rect)
-        enemies.draw(screen)
-        player_bullets.draw(screen)
-        enemy_bullets.draw(screen)
-        powerups.draw(screen)
-        particles.draw(screen)
-        hud.draw(screen, player_stats)
-        mini_map.draw(screen, player, enemies)
-        score_board.draw(screen, score_system)
-        ui.draw(screen, score_system.score, player.health, level_manager.level, achievements.get_unlocked())
-        screen_effects.apply_effects()
+        # Each draw reports the rects it touched to the renderer; draws that
+        # report nothing (None) add no dirty rects
+        with profiler.scope("background.draw"):
+            renderer.mark(background_compositor.draw(screen), trail=False)
+        # Sprites are drawn between their last two simulated positions
+        with profiler.scope("sprites.draw"):
+            renderer.mark(interpolator.draw(screen, (player,), timestep.alpha))
+            for group in sprite_groups:
+                renderer.mark(interpolator.draw(screen, group, timestep.alpha))
+            if args.bullets == "pool":
+                renderer.mark(enemy_bullets.draw(screen, timestep.alpha))
+            if entity_store is not None:
+                renderer.mark(render_system(entity_store, screen))  # Drawn at their latest tick, not interpolated
+        with profiler.scope("particles.draw"):
+            renderer.mark(particles.draw(screen))
+        with profiler.scope("hud.draw"):
+            renderer.mark(hud.draw(screen, player_stats))
+            renderer.mark(mini_map.draw(screen, player, enemies))
+            renderer.mark(score_board.draw(screen, score_system))
+            renderer.mark(ui.draw(screen, score_system.score, player.health, level_manager.level, achievements.get_unlocked()))
+        with profiler.scope("effects"):
+            if screen_effects.active:
+                renderer.invalidate()
+            screen_effects.apply_effects()
+        if profiler.overlay_visible:
+            renderer.mark(profiler.draw(screen))
 
-        pygame.display.flip()
-        clock.tick(FPS)
+        with profiler.scope("present"):
+            renderer.present()
+        profiler.end_frame()
+        clock.tick(FPS)  # Caps rendering only; the simulation rate is SIM_HZ
         logging_system.log_frame_stats(clock.get_fps())
 
     elif game_state == "game_over":
@@ -365,21 +594,39 @@ while running:
         Game over state: Display final score and high score, allow restarting.
         Applies screen shake and fade effects for dramatic effect.
         """
-        screen_effects.apply_shake()
-        ui.draw_game_over(screen, score_system.score, highscore)
+        if args.headless:
+            # Soak runs go straight into the next game
+            headless_games += 1
+            start_new_game()
+            continue
+        if screen_changed:
+            # The game over screen is static, so it is drawn once on entry
+            screen_effects.apply_shake()
+            ui.draw_game_over(screen, score_system.score, highscore)
+            renderer.flip()
         if input_handler.is_key_pressed(K_r):
             game_state = "menu"
             music_manager.stop_music()
             logging_system.log_event("Returned to menu from game over")
-        pygame.display.flip()
+        clock.tick(IDLE_FPS)
 
 # Cleanup
 """
 Clean up Pygame and logging resources on exit.
 Remove temporary config file if it exists.
 """
+logging_system.log_event(renderer.summary())
+logging_system.log_event(f"Simulated {timestep.ticks} ticks, dropped {timestep.dropped_ticks}")
+resource_loader.shutdown()
+input_handler.stop_recording()
+if args.profile_out:
+    profiler.export(args.profile_out)
 pygame.quit()
-logging_system.close()
 if os.path.exists("config.json"):
     os.remove("config.json")
 logging_system.log_event("Game terminated")
+logging_system.close()
+if args.headless:
+    elapsed = max(time.perf_counter() - headless_start, 1e-9)
+    print(f"Headless: {timestep.ticks} ticks in {elapsed:.2f} s "
+          f"({timestep.ticks / elapsed:.0f} ticks/s), {headless_games} games over")
@@ -1,30 +1,43 @@
 # menu.py - Expanded menus with more options and submenus
 import pygame
 from pygame.locals import *
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, MENU_FONT_SIZE, COLOR_WHITE, COLOR_YELLOW
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, MENU_FONT_SIZE, COLOR_BLACK, COLOR_WHITE, COLOR_YELLOW
+from text_cache import text_cache
 
 class Menu:
     """
-    Base menu class.
+    Base menu class. Menus only re-render when their selection or content
+    changed, or after invalidate(); draw() returns whether it rendered.
     """
     def __init__(self, screen):
         self.screen = screen
         self.font = pygame.font.Font(None, MENU_FONT_SIZE)
         self.options = []
         self.selected = 0
+        self.needs_redraw = True
 
-    def draw(self):
+    def invalidate(self):
+        self.needs_redraw = True
+
+    def draw(self, screen=None):
+        if not self.needs_redraw:
+            return False
         self.screen.fill(COLOR_BLACK)
         for i, option in enumerate(self.options):
             color = COLOR_YELLOW if i == self.selected else COLOR_WHITE
-            text = self.font.render(option, True, color)
+            text = text_cache.render(self.font, option, color)
             self.screen.blit(text, (SCREEN_WIDTH // 2 - 150, 200 + i * 60))
+        self.needs_redraw = False
+        return True
 
     def handle_selection(self, keys):
+        previous = self.selected
         if keys[K_UP]:
             self.selected = (self.selected - 1) % len(self.options)
         if keys[K_DOWN]:
             self.selected = (self.selected + 1) % len(self.options)
+        if self.selected != previous:
+            self.needs_redraw = True
         if keys[K_RETURN]:
             return self.options[self.selected].lower().replace(' ', '_')
         return None
@@ -49,10 +62,36 @@ class SettingsMenu(Menu):
         return 'normal'
 
 class HighScoreMenu(Menu):
+    def __init__(self, screen):
+        super().__init__(screen)
+        self.shown_scores = None
+
     def draw(self, screen, scores):
-        super().draw()
+        if scores != self.shown_scores:
+            self.shown_scores = list(scores)
+            self.needs_redraw = True
+        if not super().draw():
+            return False
         for i, (score, name, date) in enumerate(scores):
-            text = self.font.render(f"{i+1}. {name} - {score} ({date})", True, COLOR_WHITE)
+            text = text_cache.render(self.font, f"{i+1}. {name} - {score} ({date})", COLOR_WHITE)
             self.screen.blit(text, (SCREEN_WIDTH // 2 - 200, 100 + i * 40))
+        return True
+
+class LoadingScreen:
+    """
+    Progress bar shown while an asset group loads.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.font = pygame.font.Font(None, MENU_FONT_SIZE)
+
+    def draw(self, done, total):
+        self.screen.fill(COLOR_BLACK)
+        bar = pygame.Rect(SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2, 400, 24)
+        filled = bar.width * done // total if total else bar.width
+        pygame.draw.rect(self.screen, COLOR_WHITE, (bar.x, bar.y, filled, bar.height))
+        pygame.draw.rect(self.screen, COLOR_WHITE, bar, 2)
+        text = text_cache.render(self.font, "Loading...", COLOR_WHITE)
+        self.screen.blit(text, text.get_rect(midbottom=(SCREEN_WIDTH // 2, bar.y - 20)))
 
 # Add credits menu, etc.
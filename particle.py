@@ -1,72 +1,220 @@
 # particle.py - Expanded particle system with more types
 import pygame
-import random
-from constants import PARTICLE_LIFETIME, EXPLOSION_PARTICLES, COLOR_RED, COLOR_YELLOW, COLOR_GRAY, COLOR_WHITE
+from collections import OrderedDict
+import numpy as np
+from constants import (
+    PARTICLE_LIFETIME, EXPLOSION_PARTICLES, MAX_PARTICLES, PARTICLE_ALPHA_STEPS,
+    PARTICLE_STAMP_CACHE_SIZE, COLOR_RED, COLOR_YELLOW, COLOR_GRAY, COLOR_WHITE
+)
+from rng import rng
+
+def quantize_alpha(alpha, steps=PARTICLE_ALPHA_STEPS):
+    """
+    Snap alpha (scalar or array) to one of `steps` evenly spaced levels between 0 and 255.
+    """
+    bucket = np.rint(np.asarray(alpha, dtype=np.float32) * ((steps - 1) / 255.0))
+    return (bucket * 255 // (steps - 1)).astype(np.int32)
+
+class ParticleStampCache:
+    """
+    Shared, bounded cache of pre-rendered particle stamps keyed by (color, size, quantized alpha).
+    Stamps are shared between particles and must never be drawn on.
+    """
+    def __init__(self, max_size=PARTICLE_STAMP_CACHE_SIZE, alpha_steps=PARTICLE_ALPHA_STEPS):
+        self.max_size = max_size
+        self.alpha_steps = alpha_steps
+        self.stamps = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, color, size, alpha=255):
+        key = (tuple(color), int(size), int(quantize_alpha(alpha, self.alpha_steps)))
+        stamp = self.stamps.get(key)
+        if stamp is not None:
+            self.hits += 1
+            self.stamps.move_to_end(key)
+            return stamp
+        self.misses += 1
+        stamp = pygame.Surface((key[1], key[1]))
+        stamp.fill(key[0])
+        stamp.set_alpha(key[2])
+        self.stamps[key] = stamp
+        if len(self.stamps) > self.max_size:
+            self.stamps.popitem(last=False)
+        return stamp
+
+    def clear(self):
+        self.stamps.clear()
+        self.hits = 0
+        self.misses = 0
+
+stamp_cache = ParticleStampCache()
 
 class Particle(pygame.sprite.Sprite):
     """
-    Base particle.
+    Base particle. Subclasses describe their look and motion with class attributes,
+    which ParticleSystem also reads to build its particle kinds.
     """
-    def __init__(self, x, y, color, vel_range=3, lifetime=PARTICLE_LIFETIME, size=5):
+    color = COLOR_WHITE
+    vel_range = 3
+    lifetime = PARTICLE_LIFETIME
+    size = 5
+    fade_rate = 5
+
+    def __init__(self, x, y, color=None, vel_range=None, lifetime=None, size=None):
         super().__init__()
-        self.image = pygame.Surface((size, size))
-        self.image.fill(color)
+        self.size = self.size if size is None else size
+        self.color = self.color if color is None else color
+        vel_range = self.vel_range if vel_range is None else vel_range
+        self.image = stamp_cache.get(self.color, self.size)
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        self.vel_x = random.uniform(-vel_range, vel_range)
-        self.vel_y = random.uniform(-vel_range, vel_range)
-        self.lifetime = lifetime
+        self.vel_x = rng.cosmetic.uniform(-vel_range, vel_range)
+        self.vel_y = rng.cosmetic.uniform(-vel_range, vel_range)
+        self.lifetime = self.lifetime if lifetime is None else lifetime
         self.alpha = 255
-        self.fade_rate = 5
 
     def update(self):
         self.rect.x += self.vel_x
         self.rect.y += self.vel_y
         self.lifetime -= 1
         self.alpha = max(0, self.alpha - self.fade_rate)
-        self.image.set_alpha(self.alpha)
+        self.image = stamp_cache.get(self.color, self.size, self.alpha)
         if self.lifetime <= 0:
             self.kill()
 
 class SmokeParticle(Particle):
-    def __init__(self, x, y):
-        super().__init__(x, y, COLOR_GRAY, vel_range=1, lifetime=60, size=10)
-        self.fade_rate = 3
+    color = COLOR_GRAY
+    vel_range = 1
+    lifetime = 60
+    size = 10
+    fade_rate = 3
 
 class FireParticle(Particle):
-    def __init__(self, x, y):
-        super().__init__(x, y, COLOR_RED, vel_range=4, lifetime=25, size=8)
+    color = COLOR_RED
+    vel_range = 4
+    lifetime = 25
+    size = 8
 
 class SparkParticle(Particle):
-    def __init__(self, x, y):
-        super().__init__(x, y, COLOR_YELLOW, vel_range=5, lifetime=15, size=3)
+    color = COLOR_YELLOW
+    vel_range = 5
+    lifetime = 15
+    size = 3
 
 class DebrisParticle(Particle):
-    def __init__(self, x, y):
-        super().__init__(x, y, COLOR_GRAY, vel_range=2, lifetime=40, size=6)
+    color = COLOR_GRAY
+    vel_range = 2
+    lifetime = 40
+    size = 6
 
 class GlowParticle(Particle):
-    def __init__(self, x, y):
-        super().__init__(x, y, COLOR_WHITE, vel_range=0.5, lifetime=50, size=4)
-        self.fade_rate = 2
+    color = COLOR_WHITE
+    vel_range = 0.5
+    lifetime = 50
+    size = 4
+    fade_rate = 2
+
+# Kind index -> particle class; the index is what ParticleSystem stores per particle
+PARTICLE_KINDS = (SmokeParticle, FireParticle, SparkParticle, DebrisParticle, GlowParticle)
+SMOKE, FIRE, SPARK, DEBRIS, GLOW = range(len(PARTICLE_KINDS))
+
+class ParticleSystem:
+    """
+    Particle engine backed by preallocated NumPy arrays (struct of arrays).
+    Live particles are packed at the front of every column; update() integrates,
+    fades and expires all of them in one vectorized step.
+    """
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.alpha = np.zeros(capacity, dtype=np.float32)
+        self.fade_rate = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self._columns = (self.pos, self.vel, self.lifetime, self.alpha,
+                         self.fade_rate, self.color, self.size, self.kind)
+        # Per-kind lookup tables indexed by the kind column
+        self._vel_range = np.array([k.vel_range for k in PARTICLE_KINDS], dtype=np.float32)
+        self._lifetime = np.array([k.lifetime for k in PARTICLE_KINDS], dtype=np.int32)
+        self._fade_rate = np.array([k.fade_rate for k in PARTICLE_KINDS], dtype=np.float32)
+        self._color = np.array([k.color for k in PARTICLE_KINDS], dtype=np.uint8)
+        self._size = np.array([k.size for k in PARTICLE_KINDS], dtype=np.int32)
+        self.stamps = stamp_cache
+        self.rng = rng.numpy('cosmetic')
+
+    def __len__(self):
+        return self.count
+
+    def empty(self):
+        self.count = 0
+
+    def spawn(self, kinds, pos):
+        """
+        Spawn one particle per entry of kinds at pos. Particles beyond capacity are dropped.
+        """
+        kinds = np.asarray(kinds, dtype=np.int8)[:self.capacity - self.count]
+        n = len(kinds)
+        if n == 0:
+            return
+        start, end = self.count, self.count + n
+        vel_range = self._vel_range[kinds]
+        self.pos[start:end] = pos
+        self.vel[start:end] = self.rng.uniform(-1.0, 1.0, (n, 2)) * vel_range[:, None]
+        self.lifetime[start:end] = self._lifetime[kinds]
+        self.alpha[start:end] = 255
+        self.fade_rate[start:end] = self._fade_rate[kinds]
+        self.color[start:end] = self._color[kinds]
+        self.size[start:end] = self._size[kinds]
+        self.kind[start:end] = kinds
+        self.count = end
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+        self.pos[:n] += self.vel[:n]
+        self.lifetime[:n] -= 1
+        np.maximum(self.alpha[:n] - self.fade_rate[:n], 0, out=self.alpha[:n])
+        alive = self.lifetime[:n] > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for column in self._columns:
+                column[:len(keep)] = column[keep]
+            self.count = len(keep)
+
+    def draw(self, screen):
+        """
+        Draw every live particle with a single Surface.blits batch of cached stamps.
+        Returns the bounding rect of everything drawn.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        topleft = (self.pos[:n] - self.size[:n, None] / 2).astype(np.int32)
+        alpha = quantize_alpha(self.alpha[:n], self.stamps.alpha_steps)
+        keys, inverse = np.unique(self.kind[:n].astype(np.int32) * 256 + alpha, return_inverse=True)
+        stamps = np.empty(len(keys), dtype=object)
+        for i, key in enumerate(keys.tolist()):
+            kind = PARTICLE_KINDS[key // 256]
+            stamps[i] = self.stamps.get(kind.color, kind.size, key % 256)
+        screen.blits(zip(stamps[inverse], topleft.tolist()), doreturn=False)
+        left, top = topleft.min(axis=0).tolist()
+        right, bottom = (topleft + self.size[:n, None]).max(axis=0).tolist()
+        return pygame.Rect(left, top, right - left, bottom - top).clip(screen.get_rect())
 
-class ParticleSystem(pygame.sprite.Group):
     def add_explosion(self, pos):
-        for _ in range(EXPLOSION_PARTICLES):
-            particle = random.choice([FireParticle, SparkParticle])(*pos)
-            self.add(particle)
-        for _ in range(15):
-            particle = SmokeParticle(*pos)
-            self.add(particle)
+        kinds = self.rng.choice((FIRE, SPARK), EXPLOSION_PARTICLES)
+        self.spawn(np.concatenate((kinds, np.full(15, SMOKE))), pos)
 
     def add_impact(self, pos):
-        for _ in range(10):
-            particle = SparkParticle(*pos)
-            self.add(particle)
+        self.spawn(np.full(10, SPARK), pos)
 
     def add_trail(self, pos):
-        for _ in range(5):
-            particle = GlowParticle(*pos)
-            self.add(particle)
+        self.spawn(np.full(5, GLOW), pos)
 
     # Add more effects
@@ -1,7 +1,7 @@
 # powerup.py - Expanded with more powerup types
 import pygame
-import random
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, POWERUP_SPEED, COLOR_GREEN, COLOR_BLUE, COLOR_YELLOW, COLOR_RED, COLOR_ORANGE
+from rng import rng
 
 class PowerUp(pygame.sprite.Sprite):
     """
@@ -24,8 +24,8 @@ class PowerUp(pygame.sprite.Sprite):
         }
         self.image.fill(colors.get(type, COLOR_WHITE))
         self.rect = self.image.get_rect()
-        self.rect.x = random.randint(0, SCREEN_WIDTH - self.rect.width)
-        self.rect.y = random.randint(-200, -50)
+        self.rect.x = rng.gameplay.randint(0, SCREEN_WIDTH - self.rect.width)
+        self.rect.y = rng.gameplay.randint(-200, -50)
 
     def update(self):
         self.rect.y += POWERUP_SPEED
@@ -0,0 +1,140 @@
+# procedural.py - New module for procedurally generated background art
+"""
+Vectorized NumPy generators for nebula and planet layers, plus an on-disk cache
+so each (kind, seed, level, resolution) bitmap is generated only once.
+Arrays use pygame.surfarray layout: shape (width, height, 4), RGBA uint8.
+"""
+import os
+import numpy as np
+import pygame
+from constants import BACKGROUND_CACHE_DIR
+
+# Anchored to the game directory so runs from anywhere share one cache
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), BACKGROUND_CACHE_DIR)
+GENERATOR_VERSION = 1  # Bump when generator output changes to invalidate cached bitmaps
+
+# Nebula color pairs, cycled by level
+NEBULA_PALETTES = (
+    ((90, 30, 160), (220, 70, 140)),
+    ((20, 80, 170), (60, 200, 210)),
+    ((150, 40, 40), (240, 150, 60)),
+    ((30, 120, 80), (170, 220, 90)),
+)
+PLANET_COLORS = ((190, 120, 70), (90, 140, 210), (170, 170, 150), (200, 90, 90), (110, 180, 120))
+
+def value_noise(width, height, cells_x, cells_y, rng):
+    """
+    Smoothly interpolated random lattice noise in [0, 1] that tiles in both directions.
+    """
+    lattice = rng.random((cells_x, cells_y), dtype=np.float32)
+    gx = np.arange(width, dtype=np.float32) * (cells_x / width)
+    gy = np.arange(height, dtype=np.float32) * (cells_y / height)
+    x0, y0 = gx.astype(np.int32), gy.astype(np.int32)
+    x1, y1 = (x0 + 1) % cells_x, (y0 + 1) % cells_y
+    # Smoothstep weights hide the lattice grid
+    tx, ty = gx - x0, gy - y0
+    tx, ty = tx * tx * (3 - 2 * tx), ty * ty * (3 - 2 * ty)
+    top = lattice[x0][:, y0] * (1 - tx[:, None]) + lattice[x1][:, y0] * tx[:, None]
+    bottom = lattice[x0][:, y1] * (1 - tx[:, None]) + lattice[x1][:, y1] * tx[:, None]
+    return top * (1 - ty) + bottom * ty
+
+def fractal_noise(width, height, rng, octaves=5, base_cells=3, persistence=0.5):
+    """
+    Sum octaves of value noise at doubling frequencies, normalized to [0, 1].
+    """
+    total = np.zeros((width, height), dtype=np.float32)
+    amplitude, norm = 1.0, 0.0
+    for octave in range(octaves):
+        cells = base_cells * 2 ** octave
+        total += amplitude * value_noise(width, height, cells, cells, rng)
+        norm += amplitude
+        amplitude *= persistence
+    return total / norm
+
+def generate_nebula(width, height, seed, level):
+    rng = np.random.default_rng((seed, level, 0))
+    inner, outer = (np.array(c, dtype=np.float32) for c in NEBULA_PALETTES[(level - 1) % len(NEBULA_PALETTES)])
+    density = fractal_noise(width, height, rng)
+    tint = fractal_noise(width, height, rng, octaves=3)
+    # Keep only the densest clouds and fade their edges
+    alpha = np.clip((density - 0.45) / 0.3, 0, 1) ** 1.5 * 170
+    rgba = np.empty((width, height, 4), dtype=np.uint8)
+    rgba[..., :3] = inner + (outer - inner) * tint[..., None]
+    rgba[..., 3] = alpha
+    return rgba
+
+def generate_planets(width, height, seed, level, count=None):
+    rng = np.random.default_rng((seed, level, 1))
+    rgba = np.zeros((width, height, 4), dtype=np.uint8)
+    count = 1 + level % 3 if count is None else count
+    light = np.array((-0.6, -0.5, 0.62), dtype=np.float32)
+    light /= np.linalg.norm(light)
+    for _ in range(count):
+        radius = int(rng.integers(min(width, height) // 16, min(width, height) // 6))
+        cx = int(rng.integers(radius, width - radius))
+        cy = int(rng.integers(radius, height - radius))
+        color = np.array(PLANET_COLORS[rng.integers(len(PLANET_COLORS))], dtype=np.float32)
+        size = radius * 2
+        x = (np.arange(size, dtype=np.float32) - radius + 0.5) / radius
+        nx, ny = np.meshgrid(x, x, indexing='ij')
+        r2 = nx * nx + ny * ny
+        inside = r2 < 1
+        nz = np.sqrt(np.clip(1 - r2, 0, 1))
+        # Lambert shading with a little ambient, banded by a stretched noise texture
+        shade = np.clip(nx * light[0] + ny * light[1] + nz * light[2], 0, 1) * 0.85 + 0.15
+        bands = value_noise(size, size, 2, 12, rng) * 0.35 + 0.75
+        pixels = rgba[cx - radius:cx + radius, cy - radius:cy + radius]
+        pixels[..., :3][inside] = np.clip(color * (shade * bands)[..., None], 0, 255)[inside]
+        pixels[..., 3][inside] = 255
+    return rgba
+
+def array_to_surface(rgba):
+    """
+    Copy a (width, height, 4) RGBA array into a new per-pixel-alpha Surface.
+    """
+    surface = pygame.Surface(rgba.shape[:2], pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[...] = rgba[..., :3]
+    pygame.surfarray.pixels_alpha(surface)[...] = rgba[..., 3]
+    return surface
+
+class BitmapCache:
+    """
+    Disk cache of generated RGBA arrays keyed by kind, seed, level and resolution.
+    """
+    GENERATORS = {'nebula': generate_nebula, 'planets': generate_planets}
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, kind, seed, level, width, height):
+        name = f"{kind}-v{GENERATOR_VERSION}-s{seed}-l{level}-{width}x{height}.npy"
+        return os.path.join(self.directory, name)
+
+    def load(self, kind, seed, level, width, height):
+        path = self.path(kind, seed, level, width, height)
+        try:
+            rgba = np.load(path)
+            if rgba.shape == (width, height, 4) and rgba.dtype == np.uint8:
+                self.hits += 1
+                return rgba
+        except (OSError, ValueError, EOFError):  # Missing, corrupt or truncated file
+            pass
+        self.misses += 1
+        rgba = self.GENERATORS[kind](width, height, seed, level)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temp file first so a crash never leaves a truncated bitmap behind
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, rgba)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Caching is best effort; the generated bitmap is still usable
+        return rgba
+
+    def surface(self, kind, seed, level, width, height):
+        return array_to_surface(self.load(kind, seed, level, width, height))
+
+bitmap_cache = BitmapCache()
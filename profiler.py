@@ -0,0 +1,157 @@
+# profiler.py - New module for per-subsystem frame timing
+import csv
+import json
+import time
+from contextlib import nullcontext
+import numpy as np
+import pygame
+from constants import (
+    PROFILER_HISTORY, PROFILER_OVERLAY_HEIGHT, PROFILER_OVERLAY_BUDGET_MS, PROFILER_LEGEND_INTERVAL,
+    SMALL_FONT_SIZE, COLOR_WHITE
+)
+from text_cache import text_cache, DigitAtlas
+
+# Scope colors for the overlay, cycled in order of first appearance
+PROFILER_COLORS = (
+    (230, 80, 80), (240, 160, 60), (230, 220, 80), (120, 210, 90), (70, 190, 190),
+    (80, 130, 240), (160, 100, 230), (230, 110, 200), (170, 170, 170), (150, 110, 70)
+)
+_NULL_SCOPE = nullcontext()
+
+class _Scope:
+    """
+    Reusable timer for one named scope; time spent inside adds to the current frame.
+    """
+    __slots__ = ('frame', 'name', 'start')
+
+    def __init__(self, frame, name):
+        self.frame = frame
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.frame[self.name] = self.frame.get(self.name, 0.0) + time.perf_counter() - self.start
+
+class FrameProfiler:
+    """
+    Named timing scopes, summed per frame and kept for the last `history` frames
+    in ring buffers (one per scope). When disabled, scope() hands back a shared
+    no-op context manager, so instrumented code pays one method call.
+    Scopes are not reentrant: do not nest a scope inside itself.
+    """
+    def __init__(self, enabled=False, history=PROFILER_HISTORY):
+        self.enabled = enabled
+        self.history = history
+        self.names = []
+        self.samples = {}  # Scope name -> seconds per frame, indexed by frame % history
+        self.scopes = {}
+        self.frame = {}
+        self.frames = 0
+        self.overlay_visible = False
+        self.always_on = enabled
+        self.font = None
+        self.digits = None
+        self.surface = None
+        self.legend = []
+        self.legend_frame = 0
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = _Scope(self.frame, name)
+        return scope
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        slot = self.frames % self.history
+        for name in self.frame:
+            if name not in self.samples:
+                self.names.append(name)
+                self.samples[name] = np.zeros(self.history, dtype=np.float32)
+        for name in self.names:
+            self.samples[name][slot] = self.frame.get(name, 0.0)
+        self.frame.clear()
+        self.frames += 1
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.overlay_visible or self.always_on
+
+    def recent(self):
+        """
+        (scope names, array of shape (frames, scopes) in ms), oldest frame first.
+        """
+        count = min(self.frames, self.history)
+        if not count or not self.names:
+            return self.names, np.zeros((0, len(self.names)), dtype=np.float32)
+        order = (np.arange(self.frames - count, self.frames)) % self.history
+        table = np.stack([self.samples[name][order] for name in self.names], axis=1)
+        return self.names, table * 1000
+
+    def draw(self, screen):
+        """
+        Stacked bar per frame (newest on the right) over a line at the frame
+        budget, plus a legend with each scope's mean time. Returns the drawn Rect.
+        """
+        names, table = self.recent()
+        width, height = self.history, PROFILER_OVERLAY_HEIGHT
+        if self.font is None:
+            self.font = pygame.font.Font(None, SMALL_FONT_SIZE)
+            self.digits = DigitAtlas(self.font, COLOR_WHITE)
+            self.surface = pygame.Surface((width, height))
+            self.surface.set_alpha(200)
+        # Label every pixel with the scope whose slice of the stack covers it;
+        # len(names) marks pixels above the stack. Each column is its scopes'
+        # labels repeated by their pixel heights, bottom first.
+        pixels = np.full((width, height), len(names), dtype=np.int32)
+        scale = height / (2 * PROFILER_OVERLAY_BUDGET_MS)  # Twice the frame budget fills the panel
+        if len(table):
+            tops = np.minimum(np.rint(np.cumsum(table, axis=1) * scale), height).astype(np.int32)
+            bounds = np.concatenate((np.zeros((len(table), 1), np.int32), tops,
+                                     np.full((len(table), 1), height, np.int32)), axis=1)
+            labels = np.repeat(np.tile(np.arange(len(names) + 1), len(table)), np.diff(bounds, axis=1).ravel())
+            pixels[width - len(table):, ::-1] = labels.reshape(len(table), height)
+        palette = np.array([PROFILER_COLORS[i % len(PROFILER_COLORS)] for i in range(len(names))]
+                           + [(16, 16, 16)], dtype=np.uint8)
+        pygame.surfarray.blit_array(self.surface, palette[pixels])
+        budget_y = height - int(PROFILER_OVERLAY_BUDGET_MS * scale)
+        pygame.draw.line(self.surface, COLOR_WHITE, (0, budget_y), (width, budget_y))
+        area = screen.blit(self.surface, (8, 8))
+        if self.frames - self.legend_frame >= PROFILER_LEGEND_INTERVAL or len(self.legend) != len(names):
+            # Refreshed only now and then so the numbers stay readable. Names
+            # come from the shared text cache; the changing means are drawn
+            # from the digit atlas so they never churn it
+            means = table.mean(axis=0) if len(table) else np.zeros(len(names))
+            self.legend = [(text_cache.render(self.font, f"{name} ", palette[i].tolist()), f"{mean:.2f} ms")
+                           for i, (name, mean) in enumerate(zip(names, means.tolist()))]
+            self.legend_frame = self.frames
+        y = area.bottom + 4
+        for label, value in self.legend:
+            area.union_ip(screen.blit(label, (8, y)))
+            area.union_ip(self.digits.draw(screen, value, (8 + label.get_width(), y)))
+            y += max(label.get_height(), self.digits.height)
+        return area
+
+    def export(self, path):
+        """
+        Write the recorded frames to path as CSV (one column per scope) or, for
+        .json paths, as a list of per-frame objects. Times are in milliseconds.
+        """
+        names, table = self.recent()
+        first = self.frames - len(table)
+        if path.endswith('.json'):
+            frames = [dict(frame=first + i, **dict(zip(names, row))) for i, row in enumerate(table.round(4).tolist())]
+            with open(path, 'w') as f:
+                json.dump({'scopes': names, 'unit': 'ms', 'frames': frames}, f)
+            return
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame'] + names)
+            for i, row in enumerate(table.round(4).tolist()):
+                writer.writerow([first + i] + row)
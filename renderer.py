@@ -0,0 +1,80 @@
+# renderer.py - New module for presenting frames to the display
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, DIRTY_RECT_THRESHOLD
+
+class DirtyRectRenderer:
+    """
+    Presents frames either with full flips or, in dirty-rect mode, by pushing
+    only the rects that changed since the last frame via pygame.display.update.
+    Draw calls report what they touched through mark(); draws that report
+    nothing (None) are skipped, and anything that changes the screen without
+    reporting rects must call invalidate() to force a full flip for that frame.
+    Frames whose dirty area exceeds threshold of the screen also flip fully.
+    """
+    def __init__(self, dirty_rects=False, threshold=DIRTY_RECT_THRESHOLD):
+        self.dirty_rects = dirty_rects
+        self.max_area = threshold * SCREEN_WIDTH * SCREEN_HEIGHT
+        self.rects = []
+        self.trails = []
+        self.prev_rects = []
+        self.full = True
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.pixels_updated = 0
+
+    def mark(self, rects, trail=True):
+        """
+        Record a Rect or list of Rects drawn this frame; None records nothing.
+        Rects are pushed again next frame to erase what moved away, unless
+        trail is False, as for background bands that stay put once pushed.
+        """
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            rects = [rects]
+        self.rects.extend(rects)
+        if trail:
+            self.trails.extend(rects)
+
+    def invalidate(self):
+        self.full = True
+
+    def flip(self):
+        """
+        Full update. The next frame is presented fully as well, since its previous
+        contents are unknown to the tracker.
+        """
+        pygame.display.flip()
+        self.full_updates += 1
+        self.pixels_updated += SCREEN_WIDTH * SCREEN_HEIGHT
+        self.rects = []
+        self.trails = []
+        self.prev_rects = []
+        self.full = True
+
+    def present(self):
+        if not self.dirty_rects:
+            self.flip()
+            return
+        # Old positions must be refreshed too, so sprites that moved leave no trail
+        dirty = self.prev_rects + self.rects
+        area = sum(rect.width * rect.height for rect in dirty)
+        if self.full or area > self.max_area:
+            pygame.display.flip()
+            self.full_updates += 1
+            self.pixels_updated += SCREEN_WIDTH * SCREEN_HEIGHT
+        else:
+            pygame.display.update(dirty)
+            self.partial_updates += 1
+            self.pixels_updated += area
+        self.prev_rects = self.trails
+        self.rects = []
+        self.trails = []
+        self.full = False
+
+    def summary(self):
+        frames = self.full_updates + self.partial_updates
+        average = self.pixels_updated // frames if frames else 0
+        mode = "dirty-rect" if self.dirty_rects else "full-flip"
+        return (f"Renderer ({mode}): {frames} frames, {self.full_updates} full, "
+                f"{self.partial_updates} partial, {average} px/frame on average")
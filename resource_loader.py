@@ -1,17 +1,91 @@
 # resource_loader.py - New module for loading resources
+import os
+from concurrent.futures import ThreadPoolExecutor
 import pygame
+from constants import ASSET_DIR, ASSET_PACK_PATH, MAX_LEVEL, RESOURCE_LOADER_WORKERS, ATLAS_MAX_SPRITE
+from sprite_atlas import SpriteAtlas
+from asset_pack import AssetPack
+
+# Assets by group as (kind, name, file under ASSET_DIR). The menu group is loaded
+# before the first frame; gameplay streams in behind the menu; level and boss
+# groups are requested when they are first needed.
+ASSET_MANIFEST = {
+    'menu': [
+        ('image', 'logo', 'images/logo.png'),
+        ('image', 'menu_background', 'images/menu_background.png'),
+        ('sound', 'select', 'sounds/select.wav'),
+    ],
+    'gameplay': [
+        ('image', 'player', 'images/player.png'),
+        ('image', 'player_bullet', 'images/player_bullet.png'),
+        ('image', 'enemy_bullet', 'images/enemy_bullet.png'),
+        ('image', 'powerup', 'images/powerup.png'),
+        ('sound', 'hit', 'sounds/hit.wav'),
+        ('sound', 'explosion', 'sounds/explosion.wav'),
+        ('sound', 'powerup', 'sounds/powerup.wav'),
+        ('sound', 'game_over', 'sounds/game_over.wav'),
+    ],
+    'boss': [
+        ('image', 'boss', 'images/boss.png'),
+        ('image', 'final_boss', 'images/final_boss.png'),
+        ('sound', 'boss_warning', 'sounds/boss_warning.wav'),
+    ],
+}
+ASSET_MANIFEST.update({
+    f'level{level}': [('image', f'level{level}_enemies', f'images/level{level}/enemies.png')]
+    for level in range(1, MAX_LEVEL + 1)
+})
+
+def to_display_format(surface):
+    """
+    Convert a decoded image to the display's pixel format so blitting it needs no
+    per-pixel conversion. Colorkeyed art also gets RLE acceleration. Needs a display.
+    """
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        surface = surface.convert()
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
 
 class ResourceLoader:
     """
-    Loads images, sounds, fonts.
+    Loads images, sounds, fonts. Images and sounds are decoded on a thread pool;
+    the *_async methods and request_group return futures immediately, and
+    get_image/get_sound block only if the asset is still decoding.
+    Assets that fail to load are recorded in errors and come back as the default.
+    images holds raw decodes; get_image hands out display-format copies (or atlas
+    subsurfaces after pack_group) and must be called from the main thread.
+    Assets found in the prebuilt asset pack (see asset_pack.py) skip decoding
+    entirely and are materialized from it on first use.
     """
-    def __init__(self):
+    def __init__(self, max_workers=RESOURCE_LOADER_WORKERS, manifest=ASSET_MANIFEST, asset_dir=ASSET_DIR,
+                 pack_path=ASSET_PACK_PATH):
         self.images = {}
         self.sounds = {}
         self.fonts = {}
+        self.prepared = {}  # Display-format images, filled on the main thread
+        self.atlas = SpriteAtlas()
+        self.packed = set()
+        self.errors = {}
+        self.manifest = manifest
+        self.asset_dir = asset_dir
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='resource-loader')
+        self.pending = {}  # Asset name -> Future
+        self.groups = {}  # Group name -> futures of its assets
+        self.pack = None
+        if pack_path is not None:
+            try:
+                self.pack = AssetPack(pack_path)
+            except (OSError, ValueError):
+                pass  # No usable pack; assets are decoded from their source files
 
     def load_image(self, name, file):
         self.images[name] = pygame.image.load(file)
+        if pygame.display.get_surface() is not None:
+            self.prepared[name] = to_display_format(self.images[name])
 
     def load_sound(self, name, file):
         self.sounds[name] = pygame.mixer.Sound(file)
@@ -19,10 +93,136 @@ class ResourceLoader:
     def load_font(self, name, size):
         self.fonts[name] = pygame.font.Font(None, size)
 
+    def load_image_async(self, name, file):
+        return self._submit(self.images, name, pygame.image.load, file)
+
+    def load_sound_async(self, name, file):
+        return self._submit(self.sounds, name, pygame.mixer.Sound, file)
+
+    def _submit(self, store, name, decode, file):
+        future = self.pending.get(name)
+        if future is None:
+            future = self.executor.submit(decode, file)
+            future.add_done_callback(lambda done: self._store(store, name, done))
+            self.pending[name] = future
+        return future
+
+    def _store(self, store, name, future):
+        # Runs on the worker thread; single dict assignments are atomic
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            store[name] = future.result()
+        else:
+            self.errors[name] = error
+
+    def request_group(self, group):
+        """
+        Queue every asset of a manifest group and return their futures. Repeated
+        requests are free, so callers may request a group every frame.
+        """
+        futures = self.groups.get(group)
+        if futures is None:
+            futures = []
+            for kind, name, file in self.manifest.get(group, ()):
+                if self._in_pack(kind, name):
+                    continue
+                path = os.path.join(self.asset_dir, file)
+                if kind == 'image':
+                    futures.append(self.load_image_async(name, path))
+                else:
+                    futures.append(self.load_sound_async(name, path))
+            self.groups[group] = futures
+        return futures
+
+    def _in_pack(self, kind, name):
+        if self.pack is None:
+            return False
+        return name in self.pack if kind == 'image' else self.pack.has_sound(name)
+
+    def progress(self, group):
+        """
+        (finished, total) asset counts of a group, requesting it if needed.
+        """
+        futures = self.request_group(group)
+        return sum(future.done() for future in futures), len(futures)
+
+    def is_ready(self, group):
+        done, total = self.progress(group)
+        return done == total
+
+    def _result(self, store, name, default):
+        future = self.pending.get(name)
+        if future is not None:
+            # Block on the future itself; the store is filled by a callback
+            # that may run a moment after waiters are woken
+            try:
+                return future.result()
+            except Exception:
+                return default
+        return store.get(name, default)
+
+    def get_image(self, name, default=None):
+        image = self.prepared.get(name)
+        if image is not None:
+            return image
+        if self._in_pack('image', name):
+            self.prepared[name] = self.pack.image(name)
+            return self.prepared[name]
+        image = self._result(self.images, name, None)
+        if image is None:
+            return default
+        if pygame.display.get_surface() is None:
+            return image
+        self.prepared[name] = to_display_format(image)
+        return self.prepared[name]
+
+    def convert_all(self):
+        """
+        Convert every image decoded so far; call once the display exists.
+        """
+        for name in list(self.images):
+            if name not in self.prepared:
+                self.get_image(name)
+
+    def get_sound(self, name, default=None):
+        if self._in_pack('sound', name):
+            return self.pack.sound(name)
+        return self._result(self.sounds, name, default)
+
+    def pack_group(self, group, max_size=ATLAS_MAX_SPRITE):
+        """
+        Move the group's small per-pixel-alpha images into the sprite atlas, so
+        get_image returns atlas subsurfaces for them. Blocks until the group has
+        loaded; packing a group again is free. Colorkeyed art stays separate to
+        keep its RLE acceleration.
+        """
+        if group in self.packed:
+            return
+        self.packed.add(group)
+        small = {}
+        for kind, name, file in self.manifest.get(group, ()):
+            image = self.get_image(name) if kind == 'image' else None
+            if (image is not None and image.get_colorkey() is None
+                    and image.get_width() <= max_size and image.get_height() <= max_size):
+                small[name] = image
+        self.prepared.update(self.atlas.pack(small))
+
     def load_all_images(self):
-        # Placeholder for loading all
-        pass
+        # Queues every image in the manifest; prefer request_group to load on demand
+        for assets in self.manifest.values():
+            for kind, name, file in assets:
+                if kind == 'image':
+                    self.load_image_async(name, os.path.join(self.asset_dir, file))
 
     def load_all_sounds(self):
-        # Placeholder
-        pass
+        for assets in self.manifest.values():
+            for kind, name, file in assets:
+                if kind == 'sound':
+                    self.load_sound_async(name, os.path.join(self.asset_dir, file))
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.pack is not None:
+            self.pack.close()
@@ -0,0 +1,59 @@
+# rng.py - New module for seeded random number streams
+import random
+import zlib
+import numpy as np
+
+class RNGService:
+    """
+    Per-game random numbers. Every named stream is derived from one master seed,
+    so a game replays identically from its seed, and drawing from one stream never
+    shifts another: cosmetic effects can use as much randomness as they like
+    without changing gameplay outcomes. stream() hands out random.Random
+    instances; numpy() hands out NumPy generators for vectorized cosmetic work.
+    Streams are reseeded in place, so holding on to one across games is safe.
+    """
+    def __init__(self, seed=None):
+        self.streams = {}
+        self.generators = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """
+        Start every stream over from a new master seed; None picks a fresh one.
+        """
+        self.seed = random.SystemRandom().randrange(2 ** 32) if seed is None else int(seed)
+        for name, stream in self.streams.items():
+            stream.seed(self._derive(name, 0))
+        for name, generator in self.generators.items():
+            generator.bit_generator.state = np.random.PCG64(self._derive(name, 1)).state
+
+    def _derive(self, name, kind):
+        # Same master seed and name always give the same child seed
+        sequence = np.random.SeedSequence([self.seed, zlib.crc32(name.encode()), kind])
+        return int(sequence.generate_state(2, np.uint64)[0])
+
+    def stream(self, name):
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = random.Random(self._derive(name, 0))
+        return stream
+
+    def numpy(self, name='cosmetic'):
+        generator = self.generators.get(name)
+        if generator is None:
+            generator = self.generators[name] = np.random.Generator(np.random.PCG64(self._derive(name, 1)))
+        return generator
+
+    @property
+    def gameplay(self):
+        return self.stream('gameplay')
+
+    @property
+    def ai(self):
+        return self.stream('ai')
+
+    @property
+    def cosmetic(self):
+        return self.stream('cosmetic')
+
+rng = RNGService()
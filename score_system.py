@@ -1,5 +1,6 @@
 # score_system.py - Expanded scoring with bonuses
 from constants import SCORE_MULTIPLIER
+from game_clock import game_clock
 
 class ScoreSystem:
     """
@@ -18,14 +19,22 @@ class ScoreSystem:
         self.combo = 0
 
     def add_score(self, value):
-        self.score += int(value * self.multiplier)
-        self.combo += 1
-        self.last_kill = pygame.time.get_ticks()
-        if self.combo % 5 == 0:
-            self.multiplier += 0.1
+        self.add_scores((value,))
+
+    def add_scores(self, values):
+        """
+        Add several kills at once; combo and multiplier advance exactly as for
+        repeated add_score calls.
+        """
+        for value in values:
+            self.score += int(value * self.multiplier)
+            self.combo += 1
+            if self.combo % 5 == 0:
+                self.multiplier += 0.1
+        self.last_kill = game_clock.get_ticks()
 
     def check_combo(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_kill > self.combo_timeout:
             self.combo = 0
             self.multiplier = 1.0
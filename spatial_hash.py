@@ -0,0 +1,62 @@
+# spatial_hash.py - New module for broad-phase collision queries
+from constants import COLLISION_CELL_SIZE
+
+class SpatialHash:
+    """
+    Uniform grid that buckets sprites by the cells their rect overlaps.
+    Queries return sprites in insertion order, so results line up with
+    iterating the source group the way pygame.sprite.spritecollide does.
+    """
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _span(self, rect):
+        """
+        Inclusive cell range (x0, y0, x1, y1) covered by rect, negative sizes included.
+        """
+        size = self.cell_size
+        left, right = min(rect.left, rect.right), max(rect.left, rect.right)
+        top, bottom = min(rect.top, rect.bottom), max(rect.top, rect.bottom)
+        return (left // size, top // size,
+                max(left, right - 1) // size, max(top, bottom - 1) // size)
+
+    def insert(self, sprite, index):
+        x0, y0, x1, y1 = self._span(sprite.rect)
+        cells = self.cells
+        entry = (index, sprite)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def rebuild(self, sprites):
+        self.cells.clear()
+        for index, sprite in enumerate(sprites):
+            self.insert(sprite, index)
+
+    def query(self, rect):
+        """
+        Return every sprite sharing a cell with rect, deduplicated and in insertion order.
+        """
+        x0, y0, x1, y1 = self._span(rect)
+        if x0 == x1 and y0 == y1:
+            # Fast path: a bucket holds each sprite once, already in insertion order
+            return [sprite for _, sprite in self.cells.get((x0, y0), ())]
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return [found[index] for index in sorted(found)]
+
+    def collide(self, rect):
+        colliderect = rect.colliderect
+        return [sprite for sprite in self.query(rect) if colliderect(sprite.rect)]
@@ -0,0 +1,69 @@
+# sprite_atlas.py - New module for packing small sprites into shared surfaces
+import pygame
+from constants import ATLAS_PAGE_SIZE, ATLAS_PADDING
+
+class SpriteAtlas:
+    """
+    Packs small sprites into shared per-pixel-alpha pages with a shelf packer and
+    hands back subsurfaces, which blit like ordinary surfaces while every sprite
+    of a page shares one block of display-format pixels. Pack sprites tallest
+    first (see pack) to keep shelves tight.
+    """
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.regions = {}
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def _new_page(self):
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def fits(self, surface):
+        width, height = surface.get_size()
+        return width + self.padding <= self.page_size and height + self.padding <= self.page_size
+
+    def add(self, name, surface):
+        """
+        Copy surface into the atlas and return its subsurface. Sprites too big for
+        a page are returned unchanged.
+        """
+        if not self.fits(surface):
+            return surface
+        width, height = surface.get_size()
+        if not self.pages:
+            self._new_page()
+        if self.shelf_x + width + self.padding > self.page_size:
+            # Shelf full: start a new one above the tallest sprite of this one
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height
+            self.shelf_height = 0
+        if self.shelf_y + height + self.padding > self.page_size:
+            self._new_page()
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        # MAX onto the cleared page copies pixels and alpha exactly
+        self.pages[-1].blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self.shelf_x += width + self.padding
+        self.shelf_height = max(self.shelf_height, height + self.padding)
+        region = self.pages[-1].subsurface(rect)
+        self.regions[name] = region
+        return region
+
+    def pack(self, surfaces):
+        """
+        Add a dict of name -> surface, tallest first; returns name -> subsurface.
+        """
+        order = sorted(surfaces, key=lambda name: surfaces[name].get_height(), reverse=True)
+        return {name: self.add(name, surfaces[name]) for name in order}
+
+    def get(self, name, default=None):
+        return self.regions.get(name, default)
@@ -0,0 +1,33 @@
+# test_collisions.py - Differential tests for the CollisionManager strategies
+"""
+Every collision strategy must produce exactly the hits, events and side effects
+of the plain pygame.sprite path on randomized scenes, including degenerate ones
+with zero, negative and edge-touching sizes. The scenes come from
+benchmarks/bench_collisions.py, which runs the same check before timing.
+Run from the repository root: python -m pytest tests
+"""
+import os
+import sys
+import random
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+from collision_manager import CollisionManager
+from bench_collisions import make_scene, run_frame
+
+SCENES = 60
+
+@pytest.mark.parametrize('strategy', CollisionManager.STRATEGIES)
+@pytest.mark.parametrize('seed', range(SCENES))
+def test_strategy_matches_sprite_path(strategy, seed):
+    params = (random.Random(seed).randint(0, 400), random.Random(-seed).randint(0, 60))
+    degenerate = seed % 2 == 1
+    expected = run_frame('sprite', make_scene(*params, seed, degenerate=degenerate))
+    assert run_frame(strategy, make_scene(*params, seed, degenerate=degenerate)) == expected
+
+@pytest.mark.parametrize('strategy', CollisionManager.STRATEGIES)
+def test_strategy_handles_empty_scene(strategy):
+    expected = run_frame('sprite', make_scene(0, 0, seed=0))
+    assert run_frame(strategy, make_scene(0, 0, seed=0)) == expected
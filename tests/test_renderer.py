@@ -0,0 +1,56 @@
+# test_renderer.py - Dirty-rect presentation of a playing frame
+"""
+Runs the real background layer stack through DirtyRectRenderer with a moving
+sprite and HUD draws that report nothing, and checks that frames in which the
+nebula and planets do not scroll are pushed with display.update(rects).
+Run from the repository root: python -m pytest tests
+"""
+import os
+import sys
+import pygame
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+FRAMES = 120
+
+def run_frames(monkeypatch):
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    from background import Background, StarField, NebulaBackground, PlanetBackground, BackgroundCompositor
+    from renderer import DirtyRectRenderer
+    layers = [Background(), StarField(), NebulaBackground(), PlanetBackground()]
+    compositor = BackgroundCompositor(layers)
+    renderer = DirtyRectRenderer(dirty_rects=True)
+    updates = []
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: updates.append(list(rects)))
+    for frame in range(FRAMES):
+        for layer in layers:
+            layer.update()
+        renderer.mark(compositor.draw(screen), trail=False)
+        renderer.mark(screen.fill((0, 255, 0), (100 + frame, 400, 50, 40)))
+        renderer.mark(None)  # A HUD draw that reports nothing
+        renderer.present()
+    return renderer, updates
+
+def test_typical_frames_take_the_partial_path(monkeypatch):
+    renderer, updates = run_frames(monkeypatch)
+    # The nebula changes most of the screen on the frames it scrolls (every
+    # other one); the frames in between only push the sprite and star rects
+    assert renderer.partial_updates >= FRAMES // 2 - 1
+    assert len(updates) == renderer.partial_updates
+    assert all(sum(rect.width * rect.height for rect in rects) < SCREEN_WIDTH * SCREEN_HEIGHT // 4
+               for rects in updates)
+
+def test_reporting_nothing_does_not_force_a_flip(monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    from renderer import DirtyRectRenderer
+    renderer = DirtyRectRenderer(dirty_rects=True)
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: None)
+    renderer.present()  # The first frame is always full
+    renderer.mark(None)
+    renderer.mark(pygame.Rect(0, 0, 10, 10))
+    renderer.present()
+    assert (renderer.full_updates, renderer.partial_updates) == (1, 1)
@@ -0,0 +1,81 @@
+# text_cache.py - New module for caching rendered text
+import pygame
+from collections import OrderedDict
+from constants import TEXT_CACHE_SIZE
+
+class TextCache:
+    """
+    Shared, bounded LRU cache of rendered text surfaces keyed by
+    (font, text, color, antialias). Surfaces are shared and must never be drawn on.
+    """
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, str(text), tuple(color), bool(antialias))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(key[1], key[3], key[2])
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+text_cache = TextCache()
+
+class DigitAtlas:
+    """
+    Pre-rendered glyphs for numeric counters. Numbers are drawn glyph by glyph,
+    so a changing score never costs a font.render call. Characters outside
+    GLYPHS are rendered the first time they are drawn and kept.
+    """
+    GLYPHS = "0123456789,.-+x:%/ "
+
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.glyphs = {char: font.render(char, antialias, color) for char in self.GLYPHS}
+        self.height = font.get_linesize()
+
+    def glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.glyphs[char] = self.font.render(char, self.antialias, self.color)
+        return glyph
+
+    def size(self, text):
+        return sum(self.glyph(char).get_width() for char in str(text)), self.height
+
+    def draw(self, screen, value, pos):
+        """
+        Blit value (a number or any string) at pos; returns the covered Rect.
+        """
+        x, y = pos
+        blits = []
+        for char in str(value):
+            glyph = self.glyph(char)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        screen.blits(blits, doreturn=False)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+    def render(self, value):
+        """
+        Compose value into a new surface, for callers that need a single image.
+        """
+        surface = pygame.Surface(self.size(value), pygame.SRCALPHA)
+        self.draw(surface, value, (0, 0))
+        return surface
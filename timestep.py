@@ -0,0 +1,70 @@
+# timestep.py - New module for fixed-timestep simulation and render interpolation
+from constants import SIM_HZ, MAX_SIM_TICKS_PER_FRAME, INTERPOLATION_SNAP_DISTANCE
+
+def lerp(a, b, t):
+    return a + (b - a) * t
+
+class FixedTimestep:
+    """
+    Accumulates real frame time and hands it out as whole simulation ticks of
+    1 / hz seconds. At most max_ticks run per frame; time beyond that is dropped,
+    so a machine that cannot keep up slows the game down instead of falling
+    ever further behind. alpha is how far the leftover time reaches into the
+    next tick, for interpolating what is drawn.
+    """
+    def __init__(self, hz=SIM_HZ, max_ticks=MAX_SIM_TICKS_PER_FRAME):
+        self.dt = 1.0 / hz
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_ticks = 0
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, frame_seconds):
+        """
+        Add one frame's elapsed time; returns how many ticks to simulate now.
+        """
+        self.accumulator += frame_seconds
+        ticks = int(self.accumulator // self.dt)
+        self.accumulator -= ticks * self.dt
+        if ticks > self.max_ticks:
+            self.dropped_ticks += ticks - self.max_ticks
+            ticks = self.max_ticks
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
+
+class Interpolator:
+    """
+    Remembers sprite positions before each simulation tick so draw() can place
+    sprites between their previous and current positions. New sprites, and
+    sprites that jumped further than snap_distance (wrapped or teleported),
+    are drawn where they are.
+    """
+    def __init__(self, snap_distance=INTERPOLATION_SNAP_DISTANCE):
+        self.snap_distance = snap_distance
+        self.previous = {}
+
+    def capture(self, *groups):
+        self.previous = {sprite: sprite.rect.topleft for group in groups for sprite in group}
+
+    def draw(self, screen, sprites, alpha):
+        """
+        Blit sprites at their interpolated positions; returns the drawn rects.
+        """
+        previous = self.previous
+        snap = self.snap_distance
+        blits = []
+        for sprite in sprites:
+            x, y = sprite.rect.topleft
+            old = previous.get(sprite)
+            if old is not None and abs(x - old[0]) <= snap and abs(y - old[1]) <= snap:
+                x = round(lerp(old[0], x, alpha))
+                y = round(lerp(old[1], y, alpha))
+            blits.append((sprite.image, (x, y)))
+        return screen.blits(blits)